@@ -95,12 +95,18 @@ async def startup_browser_detection():
         provide_document_converter._browser_available = False
 
 
+def build_middleware(settings: Settings) -> list:
+    """Build the middleware stack for the given settings"""
+    middleware = []
+    auth_middleware_class = create_auth_middleware(settings)
+    if auth_middleware_class:
+        middleware.append(auth_middleware_class)
+    return middleware
+
+
 settings = get_settings()
 
-middleware = []
-auth_middleware_class = create_auth_middleware(settings)
-if auth_middleware_class:
-    middleware.append(auth_middleware_class)
+middleware = build_middleware(settings)
 
 app = Litestar(
     route_handlers=[health, healthz, formats, ConvertController],
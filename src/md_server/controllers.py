@@ -102,7 +102,7 @@ class ConvertController(Controller):
         settings: Settings,
     ) -> Response[Union[ConvertResponse, ErrorResponse]]:
         """Unified conversion endpoint that handles all input types"""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Parse request to determine input type and data
@@ -142,7 +142,7 @@ class ConvertController(Controller):
                 raise ValueError("No valid input provided (url, content, or text)")
 
             # Convert SDK result to API response format
-            conversion_time_ms = int((time.time() - start_time) * 1000)
+            conversion_time_ms = int((time.perf_counter() - start_time) * 1000)
             response = self._create_success_response_from_sdk(result, start_time)
 
             # Check for content negotiation (Accept header or output_format option)
@@ -262,7 +262,7 @@ class ConvertController(Controller):
     ) -> ConvertResponse:
         """Create a successful conversion response from SDK result"""
         # Calculate total time (including SDK processing time)
-        total_time_ms = int((time.time() - start_time) * 1000)
+        total_time_ms = int((time.perf_counter() - start_time) * 1000)
 
         # Use original API source type mapping for backward compatibility
         # For URL inputs, use "url" as source_type regardless of detected format
@@ -1,13 +1,16 @@
 import asyncio
+import re
 import shutil
+import threading
 import time
 from io import BytesIO
 from pathlib import Path
-from typing import Optional, Dict, Any, Union
+from typing import ClassVar, Optional, Dict, Any, Union
 
 from markitdown import MarkItDown, StreamInfo
 
 from .config import get_logger, get_settings
+from .detection import ContentTypeDetector
 from .errors import (
     classify_http_error,
     ConversionError,
@@ -23,6 +26,11 @@ logger = get_logger("core.converter")
 # Audio MIME types that require ffmpeg
 AUDIO_MIME_TYPES = {"audio/wav", "audio/mp3", "audio/mpeg"}
 
+# Markers searched for in the first 1KB of content starting with "<"; bytes
+# patterns fold ASCII case only, matching bytes.lower()
+_HTML_TAG_PATTERN = re.compile(rb"<html", re.IGNORECASE)
+_XML_DECL_PATTERN = re.compile(rb"<\?xml", re.IGNORECASE)
+
 
 def _is_ffmpeg_available() -> bool:
     """Check if ffmpeg is available on the system."""
@@ -30,6 +38,11 @@ def _is_ffmpeg_available() -> bool:
 
 
 class DocumentConverter:
+    # MarkItDown registers its converters on construction, so each thread
+    # reuses one instance; conversions run in executor threads and the
+    # instance's requests.Session must not be shared between them
+    _thread_markitdown: ClassVar[threading.local] = threading.local()
+
     def __init__(
         self,
         ocr_enabled: bool = False,
@@ -48,10 +61,26 @@ class DocumentConverter:
         self.preserve_formatting = preserve_formatting
         self.clean_markdown = clean_markdown
 
-        self._markitdown = MarkItDown()
         self._browser_available = self._check_browser_availability()
         self._metadata_extractor = MetadataExtractor()
 
+    @property
+    def _markitdown(self) -> MarkItDown:
+        return self._get_markitdown()
+
+    @classmethod
+    def _get_markitdown(cls) -> MarkItDown:
+        markitdown = getattr(cls._thread_markitdown, "instance", None)
+        if markitdown is None:
+            markitdown = MarkItDown()
+            cls._thread_markitdown.instance = markitdown
+        return markitdown
+
+    @classmethod
+    def clear_markitdown_cache(cls) -> None:
+        """Drop every thread's MarkItDown instance so the next use builds a new one."""
+        cls._thread_markitdown = threading.local()
+
     def _check_browser_availability(self) -> bool:
         try:
             import importlib.util
@@ -63,7 +92,7 @@ class DocumentConverter:
     async def convert_file(
         self, file_path: Union[str, Path], **options
     ) -> ConversionResult:
-        start_time = time.time()
+        start_time = time.perf_counter()
         path = Path(file_path)
 
         if not path.exists():
@@ -101,7 +130,7 @@ class DocumentConverter:
         else:
             extracted = self._metadata_extractor.extract(markdown)
 
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
 
         metadata = ConversionMetadata(
             source_type="file",
@@ -127,7 +156,7 @@ class DocumentConverter:
         )
 
     async def convert_url(self, url: str, **options) -> ConversionResult:
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # SSRF validation - check URL doesn't target blocked networks
         settings = get_settings()
@@ -161,7 +190,7 @@ class DocumentConverter:
         else:
             extracted = self._metadata_extractor.extract(markdown)
 
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
 
         metadata = ConversionMetadata(
             source_type="url",
@@ -189,7 +218,7 @@ class DocumentConverter:
     async def convert_content(
         self, content: bytes, filename: Optional[str] = None, **options
     ) -> ConversionResult:
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         content_size = len(content)
         if content_size > self.max_file_size_mb * 1024 * 1024:
@@ -212,7 +241,7 @@ class DocumentConverter:
         else:
             extracted = self._metadata_extractor.extract(markdown)
 
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
 
         metadata = ConversionMetadata(
             source_type="content",
@@ -240,7 +269,7 @@ class DocumentConverter:
     async def convert_text(
         self, text: str, mime_type: str, **options
     ) -> ConversionResult:
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         text_size = len(text)
 
@@ -263,7 +292,7 @@ class DocumentConverter:
         else:
             extracted = self._metadata_extractor.extract(markdown)
 
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
 
         metadata = ConversionMetadata(
             source_type="text",
@@ -420,23 +449,25 @@ class DocumentConverter:
         if len(markdown) <= target_length:
             return markdown, False
 
-        truncated = markdown[:target_length]
+        # Work with an end index into the original string so only the final
+        # result is sliced; count/rfind accept bounds and never copy.
+        end = target_length
 
         # Rule 1: Don't break inside code blocks (odd fence count = unclosed)
-        fence_count = truncated.count("```")
+        fence_count = markdown.count("```", 0, end)
         if fence_count % 2 == 1:
-            last_fence = truncated.rfind("```")
-            truncated = truncated[:last_fence].rstrip()
+            end = markdown.rfind("```", 0, end)
+            while end > 0 and markdown[end - 1].isspace():
+                end -= 1
 
         # Rule 2: Prefer paragraph boundaries in final 30%
-        search_start = int(len(truncated) * 0.7)
+        search_start = int(end * 0.7)
         if search_start > 0:
-            search_region = truncated[search_start:]
-            last_break = search_region.rfind("\n\n")
+            last_break = markdown.rfind("\n\n", search_start, end)
             if last_break != -1:
-                truncated = truncated[: search_start + last_break]
+                end = last_break
 
-        return truncated.rstrip(), True
+        return markdown[:end].rstrip(), True
 
     def _apply_options(
         self, markdown: str, options: Optional[Dict[str, Any]]
@@ -527,8 +558,6 @@ class DocumentConverter:
 
     def _truncate_by_sections(self, markdown: str, limit: int) -> tuple[str, bool]:
         """Return first N markdown sections (split by ## headings)."""
-        import re
-
         parts = re.split(r"\n(?=## )", markdown)
         if len(parts) <= limit + 1:  # +1 for content before first ##
             return markdown, False
@@ -544,34 +573,14 @@ class DocumentConverter:
         return result.rstrip() + "\n\n[truncated...]", True
 
     def _detect_format(self, content: bytes, filename: Optional[str] = None) -> str:
-        format_map = {
-            ".pdf": "application/pdf",
-            ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            ".pptx": "application/vnd.openxmlformats-officedocument.presentationml.presentation",
-            ".html": "text/html",
-            ".htm": "text/html",
-            ".txt": "text/plain",
-            ".md": "text/markdown",
-            ".json": "application/json",
-            ".xml": "application/xml",
-            ".png": "image/png",
-            ".jpg": "image/jpeg",
-            ".jpeg": "image/jpeg",
-            ".gif": "image/gif",
-            ".wav": "audio/wav",
-            ".mp3": "audio/mp3",
-        }
-
         if content.startswith(b"%PDF"):
             return "application/pdf"
         elif content.startswith(b"PK"):
             return "application/zip"
         elif content.startswith(b"<"):
-            prefix = content[:1024].lower()
-            if b"<html" in prefix:
+            if _HTML_TAG_PATTERN.search(content, 0, 1024):
                 return "text/html"
-            elif b"<?xml" in prefix:
+            elif _XML_DECL_PATTERN.search(content, 0, 1024):
                 return "application/xml"
         elif content.startswith(b"\x89PNG"):
             return "image/png"
@@ -589,11 +598,13 @@ class DocumentConverter:
 
         if filename:
             suffix = Path(filename).suffix.lower()
-            if suffix in format_map:
-                return format_map[suffix]
+            mime_type = ContentTypeDetector.EXTENSION_MIME_TYPES.get(suffix[1:])
+            if mime_type:
+                return mime_type
 
         try:
-            content[:1024].decode("utf-8")
+            # A memoryview slice hands the codec the first 1KB without copying it
+            str(memoryview(content)[:1024], "utf-8")
             return "text/plain"
         except UnicodeDecodeError:
             return "application/octet-stream"
@@ -644,5 +655,6 @@ class DocumentConverter:
             "image/gif": "gif",
             "audio/wav": "wav",
             "audio/mp3": "mp3",
+            "audio/mpeg": "mp3",
         }
         return type_map.get(mime_type, "unknown")
@@ -1,7 +1,55 @@
 import mimetypes
 import base64
-from typing import Optional, Dict, Tuple
+import binascii
+import re
 from pathlib import Path
+from typing import Optional, Dict, Tuple
+
+# Every byte except C0 control characters other than tab, LF and CR; used as
+# the delete set for bytes.translate so only non-printable bytes remain
+_PRINTABLE_BYTES = bytes(b for b in range(256) if b >= 32 or b in (9, 10, 13))
+
+# HTML markers searched for in the first 512 bytes; bytes patterns fold ASCII
+# case only, matching bytes.lower()
+_HTML_MARKER_PATTERN = re.compile(rb"<html|<!doctype html", re.IGNORECASE)
+
+# Leading-byte classes for text content: 0 = ASCII whitespace (as str.isspace
+# sees it), 1 = markdown marker (# or *), 2 = other ASCII, 3 = non-ASCII
+_LEADING_BYTE_CLASS = bytes(
+    0 if b < 128 and chr(b).isspace() else 1 if b in b"#*" else 2 if b < 128 else 3
+    for b in range(256)
+)
+_LEADING_MARKDOWN = b"\x01"
+_LEADING_ASCII = b"\x02"
+
+# Base64 characters decoded to look for a magic signature; 24 characters
+# yield 18 bytes, more than the longest MAGIC_BYTES entry
+_BASE64_PROBE_CHARS = 24
+
+# Base64 payloads are validated in slices of this many characters (a multiple
+# of 4) so a large attachment is never held in decoded form
+_BASE64_CHUNK_CHARS = 64 * 1024
+
+
+def _base64_decodes(encoded: str) -> bool:
+    """Check that base64 decodes, one slice at a time."""
+    try:
+        for start in range(0, len(encoded), _BASE64_CHUNK_CHARS):
+            binascii.a2b_base64(encoded[start : start + _BASE64_CHUNK_CHARS])
+    except ValueError:
+        # binascii.Error, or non-ASCII characters in the slice
+        return False
+    return True
+
+
+def index_by_first_byte(
+    signatures: Dict[bytes, str],
+) -> Tuple[Tuple[Tuple[bytes, str], ...], ...]:
+    """Group signatures into 256 slots by leading byte, keeping declaration order."""
+    index: list = [[] for _ in range(256)]
+    for signature, mime_type in signatures.items():
+        index[signature[0]].append((signature, mime_type))
+    return tuple(tuple(entries) for entries in index)
 
 
 class ContentTypeDetector:
@@ -23,6 +71,69 @@ class ContentTypeDetector:
         b"[": "application/json",
     }
 
+    # Only signatures sharing the content's first byte can match
+    _MAGIC_BY_FIRST_BYTE = index_by_first_byte(MAGIC_BYTES)
+
+    # Extensions of the formats this server converts, resolved without
+    # consulting the mimetypes registry; DocumentConverter shares this table
+    EXTENSION_MIME_TYPES = {
+        "pdf": "application/pdf",
+        "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        "pptx": "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+        "html": "text/html",
+        "htm": "text/html",
+        "md": "text/markdown",
+        "markdown": "text/markdown",
+        "txt": "text/plain",
+        "json": "application/json",
+        "xml": "application/xml",
+        "png": "image/png",
+        "jpg": "image/jpeg",
+        "jpeg": "image/jpeg",
+        "gif": "image/gif",
+        "wav": "audio/wav",
+        "mp3": "audio/mpeg",
+    }
+
+    # Source type reported in API responses for each detected MIME type
+    MIME_SOURCE_TYPES = {
+        "application/pdf": "pdf",
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document": "docx",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": "xlsx",
+        "application/vnd.openxmlformats-officedocument.presentationml.presentation": "pptx",
+        "text/html": "html",
+        "text/plain": "text",
+        "text/markdown": "markdown",
+        "application/json": "json",
+        "text/url": "url",
+        "image/png": "image",
+        "image/jpeg": "image",
+        "image/gif": "image",
+        "audio/mpeg": "audio",
+        "audio/wav": "audio",
+        "video/mp4": "video",
+    }
+
+    SUPPORTED_MIME_TYPES = frozenset(
+        {
+            "application/pdf",
+            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+            "text/html",
+            "text/plain",
+            "text/markdown",
+            "application/json",
+            "text/url",
+            "image/png",
+            "image/jpeg",
+            "image/gif",
+            "text/xml",
+            "application/xml",
+        }
+    )
+
     # Office document specific detection within ZIP files
     OFFICE_SIGNATURES = {
         "word/document.xml": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
@@ -38,16 +149,24 @@ class ContentTypeDetector:
             return None
 
         # Remove charset and other parameters
-        mime_type = content_type.split(";")[0].strip().lower()
-        return mime_type if mime_type else None
+        return content_type.partition(";")[0].strip().lower() or None
 
     @classmethod
     def detect_from_filename(cls, filename: Optional[str]) -> Optional[str]:
         if not filename:
             return None
 
-        path = Path(filename)
-        mime_type, _ = mimetypes.guess_type(path.name)
+        # The extension comes from the last path component
+        name = Path(filename).name
+
+        # Leading dots do not start an extension, so ".pdf" has none
+        dot = name.rfind(".")
+        if dot > 0 and name[:dot].lstrip("."):
+            mime_type = cls.EXTENSION_MIME_TYPES.get(name[dot + 1 :].lower())
+            if mime_type:
+                return mime_type
+
+        mime_type, _ = mimetypes.guess_type(name)
         return mime_type
 
     @classmethod
@@ -56,7 +175,7 @@ class ContentTypeDetector:
             return "text/plain"  # Empty content defaults to text/plain
 
         # Check for exact matches first
-        for signature, mime_type in cls.MAGIC_BYTES.items():
+        for signature, mime_type in cls._MAGIC_BY_FIRST_BYTE[content[0]]:
             if content.startswith(signature):
                 # Special handling for ZIP-based Office formats
                 if mime_type == "application/zip":
@@ -64,32 +183,42 @@ class ContentTypeDetector:
                 return mime_type
 
         # Check for HTML patterns anywhere in first 512 bytes
-        header = content[:512].lower()
-        if b"<html" in header or b"<!doctype html" in header:
+        if _HTML_MARKER_PATTERN.search(content, 0, 512):
             return "text/html"
 
-        # Check if it's likely text
-        try:
-            text = content.decode("utf-8")
+        # Binary files usually show a null byte almost immediately; find stops
+        # at the first one without touching the rest of a large buffer
+        if content.find(b"\x00", 0, 512) != -1:
+            return "application/octet-stream"
 
-            # Check for binary content indicators
-            if b"\x00" in content:  # Null bytes are strong indicator of binary
-                return "application/octet-stream"
+        # Check for binary content indicators in a single pass: translate keeps
+        # only the non-printable bytes, which include any null bytes. Deciding
+        # from the bytes first means binary content is never decoded.
+        non_printable = content.translate(None, _PRINTABLE_BYTES)
+        if b"\x00" in non_printable:  # Null bytes are strong indicator of binary
+            return "application/octet-stream"
 
-            # Check for high ratio of non-printable characters
-            non_printable_count = sum(
-                1 for byte in content if byte < 32 and byte not in [9, 10, 13]
-            )
-            if len(content) > 0 and non_printable_count / len(content) > 0.3:
-                return "application/octet-stream"
+        # Check for high ratio of non-printable characters
+        if len(non_printable) / len(content) > 0.3:
+            return "application/octet-stream"
 
-            if text.strip().startswith("#") or text.strip().startswith("*"):
-                return "text/markdown"
-            return "text/plain"
+        # Check if it's likely text
+        try:
+            text = content.decode("utf-8")
         except UnicodeDecodeError:
             return "application/octet-stream"
 
-        return None
+        # Classify the first non-whitespace byte of a short prefix; only a
+        # non-ASCII or all-whitespace prefix needs Unicode-aware stripping
+        lead = content[:64].translate(_LEADING_BYTE_CLASS).lstrip(b"\x00")[:1]
+        if lead == _LEADING_MARKDOWN:
+            return "text/markdown"
+        if lead == _LEADING_ASCII:
+            return "text/plain"
+
+        if text.lstrip().startswith(("#", "*")):
+            return "text/markdown"
+        return "text/plain"
 
     @classmethod
     def detect_from_content(
@@ -128,18 +257,16 @@ class ContentTypeDetector:
             elif "content" in request_data:
                 # Try to detect format from base64 content
                 try:
-                    decoded = base64.b64decode(request_data["content"])
-                    detected_format = cls.detect_from_magic_bytes(decoded)
+                    detected_format = cls._detect_base64_format(request_data["content"])
                     if detected_format:
                         return "json_content", detected_format
                 except Exception:
                     pass
 
                 # Fallback to filename detection
-                if "filename" in request_data:
-                    detected_format = cls.detect_from_filename(request_data["filename"])
-                    if detected_format:
-                        return "json_content", detected_format
+                detected_format = cls.detect_from_filename(request_data.get("filename"))
+                if detected_format:
+                    return "json_content", detected_format
 
                 return "json_content", "application/octet-stream"
             elif "text" in request_data:
@@ -167,46 +294,38 @@ class ContentTypeDetector:
 
         return "unknown", "application/octet-stream"
 
+    @classmethod
+    def _detect_base64_format(cls, encoded: str) -> Optional[str]:
+        """Detect the format of base64 content, decoding it whole only when needed.
+
+        A magic signature only needs the leading bytes, so a large payload that
+        matches one is validated slice by slice instead of decoded. The text and
+        binary checks look at every byte and get the full decode.
+        """
+        if len(encoded) > _BASE64_CHUNK_CHARS:
+            try:
+                prefix = base64.b64decode(encoded[:_BASE64_PROBE_CHARS])
+            except ValueError:
+                prefix = b""
+            if (
+                prefix
+                and any(
+                    prefix.startswith(signature)
+                    for signature, _ in cls._MAGIC_BY_FIRST_BYTE[prefix[0]]
+                )
+                and _base64_decodes(encoded)
+            ):
+                return cls.detect_from_magic_bytes(prefix)
+
+        return cls.detect_from_magic_bytes(base64.b64decode(encoded))
+
     @classmethod
     def get_source_type(cls, mime_type: str) -> str:
-        mime_to_source = {
-            "application/pdf": "pdf",
-            "application/vnd.openxmlformats-officedocument.wordprocessingml.document": "docx",
-            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": "xlsx",
-            "application/vnd.openxmlformats-officedocument.presentationml.presentation": "pptx",
-            "text/html": "html",
-            "text/plain": "text",
-            "text/markdown": "markdown",
-            "application/json": "json",
-            "text/url": "url",
-            "image/png": "image",
-            "image/jpeg": "image",
-            "image/gif": "image",
-            "audio/mpeg": "audio",
-            "audio/wav": "audio",
-            "video/mp4": "video",
-        }
-        return mime_to_source.get(mime_type, "unknown")
+        return cls.MIME_SOURCE_TYPES.get(mime_type, "unknown")
 
     @classmethod
     def is_supported_format(cls, mime_type: str) -> bool:
-        supported_formats = [
-            "application/pdf",
-            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            "application/vnd.openxmlformats-officedocument.presentationml.presentation",
-            "text/html",
-            "text/plain",
-            "text/markdown",
-            "application/json",
-            "text/url",
-            "image/png",
-            "image/jpeg",
-            "image/gif",
-            "text/xml",
-            "application/xml",
-        ]
-        return mime_type in supported_formats
+        return mime_type in cls.SUPPORTED_MIME_TYPES
 
     @classmethod
     def get_supported_formats(cls) -> dict:
@@ -167,6 +167,25 @@ def parse_http_status_from_error(error: Exception) -> tuple[Optional[int], str]:
         Tuple of (status_code, message). status_code is None if not found.
     """
     error_msg = str(error)
+
+    # Fast path for the usual "404 Client Error: Not Found for url: ..." shape.
+    # Limited to printable ASCII, where it agrees with the regex exactly.
+    if error_msg.isascii() and error_msg.isprintable():
+        parts = error_msg.split(" ", 3)
+        if (
+            len(parts) == 4
+            and len(parts[0]) == 3
+            and parts[0].isdigit()
+            and parts[1].lower() in ("client", "server")
+            and parts[2].lower() == "error:"
+            and parts[3][:1] not in ("", " ")
+        ):
+            reason = parts[3]
+            end = reason.lower().find(" for url:")
+            if end != -1:
+                reason = reason[:end]
+            return int(parts[0]), reason.strip()
+
     match = HTTP_ERROR_PATTERN.search(error_msg)
     if match:
         return int(match.group(1)), match.group(2).strip()
@@ -204,8 +223,9 @@ def classify_http_error(error: Exception, url: str) -> HTTPFetchError:
         elif 500 <= status_code < 600:
             return ServerError(url, status_code)
 
-    # Check for common error patterns in the message
-    error_lower = str(error).lower()
+    # Check for common error patterns in the message. Without a status code
+    # the parser already returned the full error string, so reuse it.
+    error_lower = (message if status_code is None else str(error)).lower()
 
     if "timeout" in error_lower or "timed out" in error_lower:
         return HTTPFetchError(
@@ -217,7 +237,7 @@ def classify_http_error(error: Exception, url: str) -> HTTPFetchError:
             ],
         )
 
-    if "connection" in error_lower or "connect" in error_lower:
+    if "connect" in error_lower:
         return HTTPFetchError(
             message=f"Connection error: {url}",
             code=ErrorCode.CONNECTION_FAILED,
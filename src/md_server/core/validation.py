@@ -1,6 +1,8 @@
 from urllib.parse import urlparse
 from typing import Optional
 
+from .detection import index_by_first_byte
+
 
 class ValidationError(Exception):
     def __init__(self, message: str, details: Optional[dict] = None):
@@ -15,6 +17,22 @@ class URLValidator:
             raise ValidationError("URL cannot be empty")
 
         url = url.strip()
+
+        # Fast path for well-formed http(s) URLs; anything unusual (non-ASCII
+        # text, whose NFKC form urlparse checks, control characters, IPv6
+        # brackets, other schemes, empty host) goes through urlparse. An empty
+        # slice is "in" any string, so "http://" falls back.
+        if url.isascii() and url.isprintable() and "[" not in url and "]" not in url:
+            head = url[:8].lower()
+            if head.startswith("http://"):
+                start = 7
+            elif head == "https://":
+                start = 8
+            else:
+                start = 0
+            if start and url[start : start + 1] not in "/?#":
+                return url
+
         parsed = urlparse(url)
 
         if not parsed.scheme:
@@ -90,13 +108,14 @@ class MimeTypeValidator:
         if len(mime_type) > 100:
             raise ValidationError("MIME type too long (max 100 characters)")
 
-        if "/" not in mime_type:
+        separators = mime_type.count("/")
+        if not separators:
             raise ValidationError("MIME type must contain '/' separator")
 
         if ".." in mime_type or "\\" in mime_type:
             raise ValidationError("Invalid characters in MIME type")
 
-        if mime_type.count("/") != 1:
+        if separators != 1:
             raise ValidationError("MIME type must contain exactly one '/' separator")
 
         return mime_type.strip().lower()
@@ -120,17 +139,20 @@ class ContentValidator:
         b"\x3c\x21\x44\x4f\x43\x54\x59\x50\x45": "text/html",  # HTML <!DOCTYPE
     }
 
+    # Only signatures sharing the content's first byte can match
+    _MAGIC_BY_FIRST_BYTE = index_by_first_byte(MAGIC_BYTES)
+
     @classmethod
     def detect_content_type(cls, content: bytes) -> str:
         if not content:
             return "application/octet-stream"
 
-        for magic, content_type in cls.MAGIC_BYTES.items():
+        for magic, content_type in cls._MAGIC_BY_FIRST_BYTE[content[0]]:
             if content.startswith(magic):
                 return content_type
 
         try:
-            content[:1024].decode("utf-8")
+            str(memoryview(content)[:1024], "utf-8")
             return "text/plain"
         except UnicodeDecodeError:
             pass
@@ -2,6 +2,18 @@ import re
 from dataclasses import dataclass
 from typing import Optional
 
+_IMAGE_PATTERN = re.compile(r"!\[([^\]]*)\]\([^)]+\)")
+_LINK_PATTERN = re.compile(r"\[([^\]]+)\]\([^)]+\)")
+_EMPHASIS_PATTERN = re.compile(r"[*_]{1,3}([^*_]+)[*_]{1,3}")
+_INLINE_CODE_PATTERN = re.compile(r"`([^`]+)`")
+_HEADING_PREFIX_PATTERN = re.compile(r"^#{1,6}\s+")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_H1_PATTERN = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+_TRAILING_MARKUP_PATTERN = re.compile(r"\s*[#*_`]+\s*$")
+
+# Escapes for a double-quoted YAML scalar, applied in a single pass
+_YAML_QUOTE_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
 
 def clean_title(title: Optional[str]) -> Optional[str]:
     """
@@ -13,26 +25,26 @@ def clean_title(title: Optional[str]) -> Optional[str]:
         return title
 
     # Remove image syntax: ![alt](url) -> alt (must come before links)
-    title = re.sub(r"!\[([^\]]*)\]\([^)]+\)", r"\1", title)
+    title = _IMAGE_PATTERN.sub(r"\1", title)
 
     # Remove link syntax: [text](url) -> text
-    title = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", title)
+    title = _LINK_PATTERN.sub(r"\1", title)
 
     # Remove bold/italic (handle nested by running multiple times)
     for _ in range(3):
-        title = re.sub(r"[*_]{1,3}([^*_]+)[*_]{1,3}", r"\1", title)
+        title = _EMPHASIS_PATTERN.sub(r"\1", title)
 
     # Remove inline code: `code` -> code
-    title = re.sub(r"`([^`]+)`", r"\1", title)
+    title = _INLINE_CODE_PATTERN.sub(r"\1", title)
 
     # Remove any remaining stray backticks
     title = title.replace("`", "")
 
     # Remove heading prefixes: # Title -> Title
-    title = re.sub(r"^#{1,6}\s+", "", title)
+    title = _HEADING_PREFIX_PATTERN.sub("", title)
 
     # Collapse multiple spaces
-    title = re.sub(r"\s+", " ", title)
+    title = _WHITESPACE_PATTERN.sub(" ", title)
 
     return title.strip()
 
@@ -73,6 +85,18 @@ def estimate_tokens(text: str, encoding: str = "cl100k_base") -> int:
         return len(text) // 4
 
 
+def _estimate_tokens_batch(texts: list[str], encoding: str) -> list[int]:
+    """Token counts for several texts from one encode_batch call."""
+    try:
+        import tiktoken
+
+        enc = tiktoken.get_encoding(encoding)
+        return [len(tokens) for tokens in enc.encode_batch(texts)]
+    except Exception:
+        # One bad text fails the whole batch; fall back per text
+        return [estimate_tokens(text, encoding) for text in texts]
+
+
 def detect_language(text: str) -> Optional[str]:
     """
     Detect language from text sample.
@@ -83,10 +107,13 @@ def detect_language(text: str) -> Optional[str]:
     Returns:
         ISO 639-1 language code (e.g., "en", "fr", "de") or None
     """
-    if not text or len(text.strip()) < 20:
+    if not text or len(text) < 20:
         return None
 
+    # Only the sample is analyzed, so stripping the whole document is wasted work
     sample = text[:5000]
+    if len(sample.strip()) < 20:
+        return None
 
     try:
         from langdetect import LangDetectException, detect
@@ -119,17 +146,20 @@ def extract_title(markdown: str) -> Optional[str]:
     if not markdown:
         return None
 
-    h1_match = re.search(r"^#\s+(.+)$", markdown, re.MULTILINE)
+    h1_match = _H1_PATTERN.search(markdown)
     if h1_match:
         title = h1_match.group(1).strip()
-        title = re.sub(r"\s*[#*_`]+\s*$", "", title)
+        title = _TRAILING_MARKUP_PATTERN.sub("", title)
         return clean_title(title) if title else None
 
-    lines = markdown.strip().split("\n")
-    for line in lines:
-        line = line.strip()
+    # Walk lines lazily; the title is usually near the top of large documents
+    start = 0
+    while start != -1:
+        end = markdown.find("\n", start)
+        line = markdown[start : end if end != -1 else None].strip()
+        start = end if end == -1 else end + 1
         if line and len(line) < 200:
-            if line.startswith("```") or line.startswith("---"):
+            if line.startswith(("```", "---")):
                 continue
             return clean_title(line)
 
@@ -159,7 +189,7 @@ def format_frontmatter(
     lines = ["---"]
 
     if title:
-        safe_title = title.replace("\\", "\\\\").replace('"', '\\"')
+        safe_title = title.translate(_YAML_QUOTE_ESCAPES)
         lines.append(f'title: "{safe_title}"')
 
     if source:
@@ -198,6 +228,28 @@ class MetadataExtractor:
             detected_language=detect_language(markdown),
         )
 
+    def extract_many(self, markdowns: list[str]) -> list[ExtractedMetadata]:
+        """
+        Extract metadata from several Markdown documents.
+
+        Tokens are counted in one batch, which tiktoken spreads across threads.
+
+        Args:
+            markdowns: Markdown documents
+
+        Returns:
+            ExtractedMetadata for each document, in input order
+        """
+        token_counts = _estimate_tokens_batch(markdowns, self.encoding)
+        return [
+            ExtractedMetadata(
+                title=extract_title(markdown),
+                estimated_tokens=tokens,
+                detected_language=detect_language(markdown),
+            )
+            for markdown, tokens in zip(markdowns, token_counts)
+        ]
+
     def with_frontmatter(
         self,
         markdown: str,
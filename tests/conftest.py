@@ -1,13 +1,13 @@
 import pytest
-import asyncio
 from pathlib import Path
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+@pytest.fixture(scope="session", autouse=True)
+def _warm_metadata_models():
+    """Load the tokenizer and language profiles once, before the first test."""
+    from md_server.metadata import MetadataExtractor
+
+    MetadataExtractor().extract("Warm-up text so language detection has enough input.")
 
 
 @pytest.fixture
@@ -20,6 +20,11 @@ def simple_html_file(test_data_dir):
     return test_data_dir / "simple.html"
 
 
+@pytest.fixture(scope="session")
+def simple_html_bytes():
+    return (Path(__file__).parent / "test_data" / "simple.html").read_bytes()
+
+
 @pytest.fixture
 def test_pdf_file(test_data_dir):
     return test_data_dir / "test.pdf"
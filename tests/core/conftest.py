@@ -0,0 +1,13 @@
+import pytest
+
+from md_server.metadata import MetadataExtractor
+
+
+@pytest.fixture(scope="session")
+def default_extractor():
+    return MetadataExtractor()
+
+
+@pytest.fixture(scope="session")
+def cl100k_extractor():
+    return MetadataExtractor(encoding="cl100k_base")
@@ -5,7 +5,6 @@ from md_server.core.browser import BrowserChecker
 
 
 class TestBrowserChecker:
-    @pytest.mark.asyncio
     async def test_is_available_success(self):
         with patch("md_server.core.browser.AsyncWebCrawler") as mock_crawler:
             mock_crawler.return_value.__aenter__ = AsyncMock()
@@ -14,31 +13,22 @@ class TestBrowserChecker:
             result = await BrowserChecker.is_available()
             assert result is True
 
-    @pytest.mark.asyncio
-    async def test_is_available_playwright_error(self):
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "playwright executable not found",
+            "browser not found",
+            "chromium executable missing",
+        ],
+        ids=["playwright", "browser", "chromium"],
+    )
+    async def test_is_available_missing_browser_error(self, message):
         with patch("md_server.core.browser.AsyncWebCrawler") as mock_crawler:
-            mock_crawler.side_effect = Exception("playwright executable not found")
+            mock_crawler.side_effect = Exception(message)
 
             result = await BrowserChecker.is_available()
             assert result is False
 
-    @pytest.mark.asyncio
-    async def test_is_available_browser_error(self):
-        with patch("md_server.core.browser.AsyncWebCrawler") as mock_crawler:
-            mock_crawler.side_effect = Exception("browser not found")
-
-            result = await BrowserChecker.is_available()
-            assert result is False
-
-    @pytest.mark.asyncio
-    async def test_is_available_chromium_error(self):
-        with patch("md_server.core.browser.AsyncWebCrawler") as mock_crawler:
-            mock_crawler.side_effect = Exception("chromium executable missing")
-
-            result = await BrowserChecker.is_available()
-            assert result is False
-
-    @pytest.mark.asyncio
     async def test_is_available_generic_error_raises(self):
         with patch("md_server.core.browser.AsyncWebCrawler") as mock_crawler:
             mock_crawler.side_effect = Exception("some other error")
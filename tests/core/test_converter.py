@@ -1,8 +1,15 @@
-import pytest
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+from markitdown import MarkItDown
+
 from md_server.core.converter import DocumentConverter
+from md_server.core.errors import URLTimeoutError
 from md_server.models import ConversionResult
 
 
@@ -39,11 +46,62 @@ class TestDocumentConverter:
         assert converter.preserve_formatting is True
         assert converter.clean_markdown is False
 
+    def test_markitdown_instance_shared_within_thread(self):
+        first = DocumentConverter()
+        second = DocumentConverter(ocr_enabled=True, timeout=60)
+        assert first._markitdown is second._markitdown
+
+    def test_markitdown_instance_per_thread(self):
+        converter = DocumentConverter()
+        barrier = threading.Barrier(2)
+
+        def worker_instance():
+            instance = converter._markitdown
+            # Keep both workers alive so they cannot be the same thread
+            barrier.wait(timeout=5)
+            return instance
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(worker_instance) for _ in range(2)]
+            first, second = [future.result() for future in futures]
+
+        assert first is not second
+        assert converter._markitdown not in (first, second)
+
+    async def test_concurrent_conversions_never_share_an_instance(self, converter):
+        used = []
+        original = MarkItDown.convert_stream
+
+        def recording_convert_stream(markitdown, *args, **kwargs):
+            used.append((threading.get_ident(), markitdown))
+            time.sleep(0.01)  # Overlap the conversions across executor threads
+            return original(markitdown, *args, **kwargs)
+
+        with patch.object(MarkItDown, "convert_stream", recording_convert_stream):
+            results = await asyncio.gather(
+                *(
+                    converter.convert_text(f"<h1>Doc {i}</h1>", "text/html")
+                    for i in range(8)
+                )
+            )
+
+        assert [result.markdown.strip() for result in results] == [
+            f"# Doc {i}" for i in range(8)
+        ]
+        owners = {}
+        for thread_id, markitdown in used:
+            assert owners.setdefault(id(markitdown), thread_id) == thread_id
+
+    def test_clear_markitdown_cache(self):
+        before = DocumentConverter()._markitdown
+        DocumentConverter.clear_markitdown_cache()
+        after = DocumentConverter()._markitdown
+        assert after is not before
+
     def test_browser_availability_check(self):
         converter = DocumentConverter()
         assert isinstance(converter._browser_available, bool)
 
-    @pytest.mark.asyncio
     async def test_convert_file_success(self, converter, simple_html_file):
         result = await converter.convert_file(simple_html_file)
         assert isinstance(result, ConversionResult)
@@ -51,13 +109,11 @@ class TestDocumentConverter:
         assert result.markdown
         assert result.metadata
 
-    @pytest.mark.asyncio
     async def test_convert_file_nonexistent(self, converter):
         nonexistent = Path("/nonexistent/file.txt")
         with pytest.raises(FileNotFoundError):
             await converter.convert_file(nonexistent)
 
-    @pytest.mark.asyncio
     async def test_convert_content_success(self, converter):
         content = b"<html><body><h1>Test</h1></body></html>"
         result = await converter.convert_content(content)
@@ -65,26 +121,24 @@ class TestDocumentConverter:
         assert result.success is True
         assert "Test" in result.markdown
 
-    @pytest.mark.asyncio
-    async def test_convert_url_success(self, converter):
-        with (
-            patch("md_server.core.converter.validate_url") as mock_validate,
-            patch(
-                "md_server.core.converter.DocumentConverter._convert_url_with_markitdown"
-            ) as mock_convert,
-        ):
-            mock_validate.return_value = "https://example.com"
-            mock_convert.return_value = "# Test Content"
-            result = await converter.convert_url("https://example.com")
-            assert result.success is True
-            assert result.markdown == "# Test Content"
+    async def test_convert_url_success(self, converter, monkeypatch):
+        async def fake_convert(self, url):
+            return "# Test Content"
+
+        monkeypatch.setattr(
+            "md_server.core.converter.validate_url", lambda url, **kwargs: url
+        )
+        monkeypatch.setattr(
+            DocumentConverter, "_convert_url_with_markitdown", fake_convert
+        )
+        result = await converter.convert_url("https://example.com")
+        assert result.success is True
+        assert result.markdown == "# Test Content"
 
-    @pytest.mark.asyncio
     async def test_convert_invalid_url(self, converter):
         with pytest.raises(ValueError):
             await converter.convert_url("not-a-url")
 
-    @pytest.mark.asyncio
     async def test_file_size_limit_validation(self, converter, tmp_path):
         # Test file size validation in convert_file method
         large_content = b"x" * (55 * 1024 * 1024)  # 55MB > 50MB default limit
@@ -94,7 +148,6 @@ class TestDocumentConverter:
         with pytest.raises(ValueError, match="File too large"):
             await converter.convert_file(large_file)
 
-    @pytest.mark.asyncio
     async def test_content_size_limit_validation(self, converter):
         # Test content size validation in convert_content method
         large_content = b"x" * (55 * 1024 * 1024)  # 55MB > 50MB default limit
@@ -102,16 +155,15 @@ class TestDocumentConverter:
         with pytest.raises(ValueError, match="Content too large"):
             await converter.convert_content(large_content)
 
-    def test_browser_availability_check_no_import(self, converter):
-        with patch("importlib.util.find_spec", return_value=None):
-            result = converter._check_browser_availability()
-            assert result is False
+    def test_browser_availability_check_no_import(self, converter, monkeypatch):
+        monkeypatch.setattr("importlib.util.find_spec", lambda name: None)
+        result = converter._check_browser_availability()
+        assert result is False
 
-    def test_browser_availability_check_with_import(self, converter):
-        with patch("importlib.util.find_spec") as mock_find_spec:
-            mock_find_spec.return_value = True  # Mock module found
-            result = converter._check_browser_availability()
-            assert result is True
+    def test_browser_availability_check_with_import(self, converter, monkeypatch):
+        monkeypatch.setattr("importlib.util.find_spec", lambda name: True)
+        result = converter._check_browser_availability()
+        assert result is True
 
     def test_detect_format_pdf_magic_bytes(self, converter):
         pdf_content = b"%PDF-1.4"
@@ -143,7 +195,6 @@ class TestDocumentConverter:
         result = converter._detect_format(text_content)
         assert result == "text/plain"
 
-    @pytest.mark.asyncio
     async def test_url_conversion_with_browser_enabled(self, converter):
         converter.js_rendering = True
         converter._browser_available = True
@@ -161,46 +212,56 @@ class TestDocumentConverter:
             assert result.markdown == "# Crawled Content"
             mock_crawl.assert_called_once_with("https://example.com")
 
-    @pytest.mark.asyncio
-    async def test_url_conversion_fallback_to_markitdown(self, converter):
+    async def test_url_conversion_fallback_to_markitdown(self, converter, monkeypatch):
         converter.js_rendering = True
         converter._browser_available = False
 
-        with (
-            patch("md_server.core.converter.validate_url") as mock_validate,
-            patch(
-                "md_server.core.converter.DocumentConverter._convert_url_with_markitdown"
-            ) as mock_convert,
-        ):
-            mock_validate.return_value = "https://example.com"
-            mock_convert.return_value = "# MarkItDown Content"
-            result = await converter.convert_url("https://example.com")
-            assert result.success is True
-            assert result.markdown == "# MarkItDown Content"
+        async def fake_convert(self, url):
+            return "# MarkItDown Content"
+
+        monkeypatch.setattr(
+            "md_server.core.converter.validate_url", lambda url, **kwargs: url
+        )
+        monkeypatch.setattr(
+            DocumentConverter, "_convert_url_with_markitdown", fake_convert
+        )
+        result = await converter.convert_url("https://example.com")
+        assert result.success is True
+        assert result.markdown == "# MarkItDown Content"
 
-    @pytest.mark.asyncio
     async def test_convert_text_with_markdown_mime(self, converter):
         text = "# Already Markdown"
         result = await converter.convert_text(text, "text/markdown")
         assert result.success is True
         assert result.markdown == "# Already Markdown"
 
-    @pytest.mark.asyncio
     async def test_convert_text_with_html_mime(self, converter):
         text = "<h1>HTML Title</h1>"
         result = await converter.convert_text(text, "text/html")
         assert result.success is True
         assert "HTML Title" in result.markdown
 
-    def test_clean_markdown_removes_empty_lines(self, converter):
-        messy_markdown = "\n\n# Title\n\n\nContent\n\n\n"
-        cleaned = converter._clean_markdown(messy_markdown)
-        assert cleaned == "# Title\n\nContent"
-
-    def test_clean_markdown_preserves_single_breaks(self, converter):
-        markdown = "Line 1\n\nLine 2"
-        cleaned = converter._clean_markdown(markdown)
-        assert cleaned == "Line 1\n\nLine 2"
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("\n\n# Title\n\n\nContent\n\n\n", "# Title\n\nContent"),
+            ("Line 1\n\nLine 2", "Line 1\n\nLine 2"),
+            ("  \n\n  # Title  \n\n  \n  Content  \n\n  ", "# Title\n\nContent"),
+            ("a\t\r\n\xa0\n\x0c\nb", "a\n\nb"),
+            ("one\ntwo", "one\ntwo"),
+            ("", ""),
+        ],
+        ids=[
+            "empty-lines",
+            "single-breaks",
+            "indented",
+            "unicode-space",
+            "no-gap",
+            "empty",
+        ],
+    )
+    def test_clean_markdown(self, converter, raw, expected):
+        assert converter._clean_markdown(raw) == expected
 
     def test_apply_options_max_length(self, converter):
         long_markdown = "x" * 100
@@ -235,7 +296,6 @@ class TestDocumentConverter:
         stream_info = converter._create_stream_info_for_content(None)
         assert stream_info is None
 
-    @pytest.mark.asyncio
     async def test_image_extraction_workflow_option(self, converter):
         # Test that image extraction option is passed through
         from md_server.models import TruncationInfo
@@ -256,23 +316,28 @@ class TestDocumentConverter:
             assert "![Test]" in result.markdown
             mock_sync.assert_called_once_with(html_content, None, options)
 
-    @pytest.mark.asyncio
     async def test_timeout_handling_in_url_conversion(self, converter):
         # Test timeout handling in URL conversion
-        # Mock asyncio.wait_for to raise TimeoutError directly (no real sleep)
-        import asyncio
+        # Let the real asyncio.wait_for fire against a short timeout, then
+        # release the blocked executor thread so it can be joined promptly
+        release = threading.Event()
+        converter.timeout = 0.05
 
-        from md_server.core.errors import URLTimeoutError
+        def slow_convert(url):
+            release.wait(5)
+            return "# Too late"
 
         with (
             patch("md_server.core.converter.validate_url") as mock_validate,
-            patch("md_server.core.converter.asyncio.wait_for") as mock_wait_for,
+            patch.object(converter, "_sync_convert_url", side_effect=slow_convert),
         ):
             mock_validate.return_value = "https://slow-website.com"
-            mock_wait_for.side_effect = asyncio.TimeoutError()
 
-            with pytest.raises(URLTimeoutError, match="timed out"):
-                await converter.convert_url("https://slow-website.com")
+            try:
+                with pytest.raises(URLTimeoutError, match="timed out"):
+                    await converter.convert_url("https://slow-website.com")
+            finally:
+                release.set()
 
     def test_sync_convert_content_calls_markitdown(self, converter):
         # Test that sync convert content properly calls MarkItDown
@@ -4,11 +4,13 @@ from md_server.core.detection import ContentTypeDetector
 import base64
 
 
-class TestContentTypeDetector:
-    @pytest.fixture
-    def detector(self):
-        return ContentTypeDetector()
+@pytest.fixture(scope="module")
+def detector():
+    # Stateless: every lookup table is built once at import time
+    return ContentTypeDetector()
+
 
+class TestContentTypeDetector:
     def test_detect_from_content_html(self, detector):
         html_content = "<html><body>Hello</body></html>"
         content_type = detector.detect_from_content(html_content.encode())
@@ -43,6 +45,27 @@ class TestContentTypeDetector:
             == "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
         )
 
+    def test_detect_from_filename_case_insensitive_and_paths(self, detector):
+        assert detector.detect_from_filename("REPORT.PDF") == "application/pdf"
+        assert detector.detect_from_filename("docs/v1.2/page.htm") == "text/html"
+        assert detector.detect_from_filename("archive.tar.md") == "text/markdown"
+
+    @pytest.mark.parametrize(
+        "filename", ["dir.d/.pdf", "uploads/.pdf", "uploads/..pdf", "docs/.hidden"]
+    )
+    def test_detect_from_filename_dotfile_in_directory(self, detector, filename):
+        assert detector.detect_from_filename(filename) is None
+
+    def test_detect_from_filename_uses_last_component(self, detector):
+        assert detector.detect_from_filename("v1.pdf/notes.md") == "text/markdown"
+        assert detector.detect_from_filename("reports/q1.pdf/") == "application/pdf"
+
+    def test_detect_from_filename_falls_back_to_mimetypes(self, detector):
+        assert detector.detect_from_filename("data.csv") == "text/csv"
+        assert detector.detect_from_filename("no_extension") is None
+        assert detector.detect_from_filename(".pdf") is None
+        assert detector.detect_from_filename("trailing.") is None
+
     def test_detect_from_filename_unknown(self, detector):
         result = detector.detect_from_filename("test.unknown")
         assert result is None
@@ -75,6 +98,45 @@ class TestContentTypeDetector:
         assert input_type == "json_content"
         assert detected_format == "application/octet-stream"
 
+    def test_detect_input_type_large_base64_content(self, detector):
+        # A signature in the leading base64 identifies a large payload
+        pdf_content = b"%PDF-1.4\n" + b"0" * 100_000
+        request_data = {"content": base64.b64encode(pdf_content).decode()}
+        input_type, detected_format = detector.detect_input_type(
+            request_data=request_data
+        )
+        assert input_type == "json_content"
+        assert detected_format == "application/pdf"
+
+    def test_detect_input_type_large_base64_binary_after_prefix(self, detector):
+        # A null byte past the leading window still marks the content as binary
+        content = b"a" * 600 + b"\x00" + b"a" * 100_000
+        request_data = {"content": base64.b64encode(content).decode()}
+        _, detected_format = detector.detect_input_type(request_data=request_data)
+        assert detected_format == "application/octet-stream"
+
+    def test_detect_input_type_large_base64_corrupt_tail(self, detector):
+        # A valid signature prefix does not count if the payload fails to decode
+        pdf_content = b"%PDF-1.4\n" + b"0" * 100_000
+        encoded = base64.b64encode(pdf_content).decode()[:-1]
+        request_data = {"content": encoded, "filename": "notes.txt"}
+        _, detected_format = detector.detect_input_type(request_data=request_data)
+        assert detected_format == "text/plain"
+
+    def test_detect_input_type_large_base64_multibyte_text(self, detector):
+        # A prefix that splits a multi-byte character is still UTF-8 text
+        text_content = ("Zürich café " * 200).encode()
+        request_data = {"content": base64.b64encode(text_content).decode()}
+        _, detected_format = detector.detect_input_type(request_data=request_data)
+        assert detected_format == "text/plain"
+
+    def test_detect_input_type_large_base64_with_line_breaks(self, detector):
+        # MIME-style wrapped base64 falls back to a full decode
+        html_content = b"<html><body>" + b"x" * 2000 + b"</body></html>"
+        request_data = {"content": base64.encodebytes(html_content).decode()}
+        _, detected_format = detector.detect_input_type(request_data=request_data)
+        assert detected_format == "text/html"
+
     def test_detect_zip_format_returns_generic(self, detector):
         # Test ZIP detection (office format detection is simplified)
         zip_content = b"PK\x03\x04"
@@ -114,6 +176,23 @@ class TestContentTypeDetector:
         result = detector.detect_from_magic_bytes(non_printable)
         assert result == "application/octet-stream"
 
+    def test_null_byte_after_text_is_binary(self, detector):
+        # A single null byte anywhere marks content as binary
+        content = b"mostly text " * 100 + b"\x00"
+        result = detector.detect_from_magic_bytes(content)
+        assert result == "application/octet-stream"
+
+    def test_invalid_utf8_is_binary(self, detector):
+        result = detector.detect_from_magic_bytes(b"text then \xff\xfe bytes")
+        assert result == "application/octet-stream"
+
+    def test_low_non_printable_ratio_is_text(self, detector):
+        # Tabs, newlines and carriage returns are printable; a few control
+        # characters below the 30% threshold keep the content textual
+        content = b"line one\tcol\r\nline two\n" + b"\x01\x02"
+        result = detector.detect_from_magic_bytes(content)
+        assert result == "text/plain"
+
     def test_detect_input_type_json_url(self, detector):
         request_data = {"url": "https://example.com"}
         input_type, detected_format = detector.detect_input_type(
@@ -167,6 +246,14 @@ class TestContentTypeDetector:
         result = detector.detect_from_content_type_header("")
         assert result is None
 
+        result = detector.detect_from_content_type_header(" ; charset=utf-8")
+        assert result is None
+
+        result = detector.detect_from_content_type_header(
+            "Multipart/Form-Data; boundary=a;b"
+        )
+        assert result == "multipart/form-data"
+
     def test_get_source_type_mapping(self, detector):
         test_cases = [
             ("application/pdf", "pdf"),
@@ -201,6 +288,21 @@ class TestContentTypeDetector:
         result = detector.detect_from_magic_bytes(markdown_content)
         assert result == "text/markdown"
 
+    @pytest.mark.parametrize(
+        "content, expected",
+        [
+            (b"  \n\t* bullet", "text/markdown"),
+            (b"\r\n## Heading", "text/markdown"),
+            (b"plain # not a heading", "text/plain"),
+            (b" " * 100 + b"# Heading after a long indent", "text/markdown"),
+            ("\u00a0# Heading after NBSP".encode(), "text/markdown"),
+            ("caf\u00e9 au lait".encode(), "text/plain"),
+            (b"   \n  ", "text/plain"),
+        ],
+    )
+    def test_markdown_lead_detection(self, detector, content, expected):
+        assert detector.detect_from_magic_bytes(content) == expected
+
     def test_empty_content_detection(self, detector):
         result = detector.detect_from_magic_bytes(b"")
         assert result == "text/plain"
@@ -211,6 +313,19 @@ class TestContentTypeDetector:
         result = detector.detect_from_magic_bytes(html_content)
         assert result == "text/html"
 
+    @pytest.mark.parametrize(
+        "content, expected",
+        [
+            (b"<!-- generated -->\n<HTML><body>x</body></HTML>", "text/html"),
+            (b"\n\n<!DocType HTML>\n<p>x</p>", "text/html"),
+            (b" " * 508 + b"<html>", "text/plain"),
+            (b" " * 507 + b"<html>", "text/html"),
+        ],
+    )
+    def test_html_marker_window(self, detector, content, expected):
+        # Markers must lie entirely within the first 512 bytes, in any case
+        assert detector.detect_from_magic_bytes(content) == expected
+
     def test_office_document_detection_simplified(self, detector):
         # Test that ZIP files are detected (office format detection is simplified in current implementation)
         zip_content = b"PK\x03\x04"  # ZIP magic bytes
@@ -67,6 +67,34 @@ class TestParseHttpStatusFromError:
         assert status_code == 404
         assert message == "not found"
 
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "404 Client Error: Not Found for url: https://example.com/page",
+            "404 Client Error: Not Found",
+            "500 SERVER ERROR: Oops FOR URL: https://example.com",
+            "502 Server Error: Bad  Gateway   for url: https://example.com",
+            "418 Client Error: for url: https://example.com",
+            "404 Client Error:  Not Found for url: https://example.com",
+            "404 Client Error:Not Found for url: https://example.com",
+            "HTTPError: 404 Client Error: Not Found for url: https://example.com",
+            "1404 Client Error: Not Found",
+            "404 Client Error: Not Found\tfor url: https://example.com",
+            "404 Client Error: Not Found\nfor url: https://example.com",
+            "404 Client Error: Caf\u00e9 for url: https://example.com",
+            "404 Other Error: Not Found",
+        ],
+    )
+    def test_fast_path_matches_regex(self, message):
+        """The string fast path must agree with the regex it short-circuits."""
+        from md_server.core.errors import HTTP_ERROR_PATTERN
+
+        match = HTTP_ERROR_PATTERN.search(message)
+        expected = (
+            (int(match.group(1)), match.group(2).strip()) if match else (None, message)
+        )
+        assert parse_http_status_from_error(Exception(message)) == expected
+
 
 class TestClassifyHttpError:
     """Tests for classify_http_error function."""
@@ -157,6 +185,8 @@ class TestClassifyHttpError:
             ("Server returned 403", ErrorCode.ACCESS_DENIED, 403),
             ("Request unauthorized", ErrorCode.ACCESS_DENIED, 401),
             ("Got 401 from API", ErrorCode.ACCESS_DENIED, 401),
+            # Parsed but unhandled status still scans the full message
+            ("302 Client Error: Found for url: x (timed out)", ErrorCode.TIMEOUT, None),
         ],
     )
     def test_classify_fallback_patterns(
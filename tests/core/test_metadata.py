@@ -2,7 +2,6 @@ import pytest
 
 from md_server.metadata import (
     ExtractedMetadata,
-    MetadataExtractor,
     detect_language,
     estimate_tokens,
     extract_title,
@@ -99,39 +98,52 @@ class TestTokenEstimation:
         assert tokens > 0
 
 
+LANGUAGE_SAMPLES = {
+    "en": "This is a sample text in English for language detection testing purposes.",
+    "fr": "Ceci est un exemple de texte en français pour tester la détection de langue.",
+    "de": "Dies ist ein Beispieltext auf Deutsch zur Spracherkennung und zum Testen.",
+    "short": "Hi",
+    "empty": "",
+    "whitespace": "   \n\t  ",
+}
+
+
+@pytest.fixture(scope="module")
+def lang_results():
+    return {key: detect_language(text) for key, text in LANGUAGE_SAMPLES.items()}
+
+
 class TestLanguageDetection:
     """Test language detection."""
 
     @pytest.mark.unit
-    def test_english(self):
-        text = (
-            "This is a sample text in English for language detection testing purposes."
-        )
-        assert detect_language(text) == "en"
+    def test_english(self, lang_results):
+        assert lang_results["en"] == "en"
 
     @pytest.mark.unit
-    def test_french(self):
-        text = "Ceci est un exemple de texte en français pour tester la détection de langue."
-        assert detect_language(text) == "fr"
+    def test_french(self, lang_results):
+        assert lang_results["fr"] == "fr"
 
     @pytest.mark.unit
-    def test_german(self):
-        text = (
-            "Dies ist ein Beispieltext auf Deutsch zur Spracherkennung und zum Testen."
-        )
-        assert detect_language(text) == "de"
+    def test_german(self, lang_results):
+        assert lang_results["de"] == "de"
+
+    @pytest.mark.unit
+    def test_short_text_returns_none(self, lang_results):
+        assert lang_results["short"] is None
 
     @pytest.mark.unit
-    def test_short_text_returns_none(self):
-        assert detect_language("Hi") is None
+    def test_empty_text_returns_none(self, lang_results):
+        assert lang_results["empty"] is None
 
     @pytest.mark.unit
-    def test_empty_text_returns_none(self):
-        assert detect_language("") is None
+    def test_whitespace_only_returns_none(self, lang_results):
+        assert lang_results["whitespace"] is None
 
     @pytest.mark.unit
-    def test_whitespace_only_returns_none(self):
-        assert detect_language("   \n\t  ") is None
+    def test_padded_short_sample_returns_none(self):
+        text = " " * 4990 + "Hello there, this text is past the sample window."
+        assert detect_language(text) is None
 
 
 class TestTitleExtraction:
@@ -251,6 +263,11 @@ class TestFrontmatter:
         result = format_frontmatter(title=r"Title with \ backslash", source_type="html")
         assert r'title: "Title with \\ backslash"' in result
 
+    @pytest.mark.unit
+    def test_escapes_backslash_before_quote(self):
+        result = format_frontmatter(title='Path \\"quoted\\"', source_type="html")
+        assert r'title: "Path \\\"quoted\\\""' in result
+
     @pytest.mark.unit
     def test_frontmatter_ends_with_newlines(self):
         result = format_frontmatter(source_type="text", tokens=100)
@@ -271,28 +288,25 @@ class TestMetadataExtractor:
     """Test MetadataExtractor class."""
 
     @pytest.mark.unit
-    def test_extract_all(self):
+    def test_extract_all(self, default_extractor):
         markdown = "# English Document\n\nThis is a sample document with enough content for language detection to work properly."
-        extractor = MetadataExtractor()
-        metadata = extractor.extract(markdown)
+        metadata = default_extractor.extract(markdown)
 
         assert metadata.title == "English Document"
         assert metadata.estimated_tokens > 0
         assert metadata.detected_language == "en"
 
     @pytest.mark.unit
-    def test_extract_returns_extracted_metadata(self):
+    def test_extract_returns_extracted_metadata(self, default_extractor):
         markdown = "# Test\n\nContent"
-        extractor = MetadataExtractor()
-        metadata = extractor.extract(markdown)
+        metadata = default_extractor.extract(markdown)
 
         assert isinstance(metadata, ExtractedMetadata)
 
     @pytest.mark.unit
-    def test_with_frontmatter(self):
+    def test_with_frontmatter(self, default_extractor):
         markdown = "# Test Title\n\nThis is some content here for testing purposes and language detection."
-        extractor = MetadataExtractor()
-        result, metadata = extractor.with_frontmatter(
+        result, metadata = default_extractor.with_frontmatter(
             markdown,
             source="https://example.com",
             source_type="html",
@@ -303,10 +317,9 @@ class TestMetadataExtractor:
         assert metadata.title == "Test Title"
 
     @pytest.mark.unit
-    def test_with_frontmatter_no_source(self):
+    def test_with_frontmatter_no_source(self, default_extractor):
         markdown = "# Title\n\nContent for testing."
-        extractor = MetadataExtractor()
-        result, metadata = extractor.with_frontmatter(
+        result, metadata = default_extractor.with_frontmatter(
             markdown,
             source=None,
             source_type="text",
@@ -316,17 +329,31 @@ class TestMetadataExtractor:
         assert "source:" not in result.split("---")[1]
 
     @pytest.mark.unit
-    def test_custom_encoding(self):
-        extractor = MetadataExtractor(encoding="cl100k_base")
+    def test_custom_encoding(self, cl100k_extractor):
         markdown = "Test content"
-        metadata = extractor.extract(markdown)
+        metadata = cl100k_extractor.extract(markdown)
         assert metadata.estimated_tokens > 0
 
     @pytest.mark.unit
-    def test_empty_markdown(self):
-        extractor = MetadataExtractor()
-        metadata = extractor.extract("")
+    def test_empty_markdown(self, default_extractor):
+        metadata = default_extractor.extract("")
 
         assert metadata.title is None
         assert metadata.estimated_tokens == 0
         assert metadata.detected_language is None
+
+    @pytest.mark.unit
+    def test_extract_many_matches_extract(self, default_extractor):
+        markdowns = [
+            "# First\n\nThis is a sample document with enough content for detection.",
+            "",
+            "Plain first line\n\nMore words here.",
+            "Special token text <|endoftext|> stays countable.",
+        ]
+        batch = default_extractor.extract_many(markdowns)
+
+        assert batch == [default_extractor.extract(md) for md in markdowns]
+
+    @pytest.mark.unit
+    def test_extract_many_empty_list(self, default_extractor):
+        assert default_extractor.extract_many([]) == []
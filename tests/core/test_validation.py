@@ -25,6 +25,11 @@ class TestURLValidator:
         result = URLValidator.validate_url(url)
         assert result == url
 
+    def test_validate_url_with_query(self):
+        url = "https://example.com/path?param=value"
+        result = URLValidator.validate_url(url)
+        assert result == url
+
     def test_validate_url_strips_whitespace(self):
         url = "  https://example.com  "
         result = URLValidator.validate_url(url)
@@ -46,6 +51,10 @@ class TestURLValidator:
         with pytest.raises(ValidationError, match="Only HTTP/HTTPS URLs allowed"):
             URLValidator.validate_url("ftp://example.com")
 
+    def test_validate_url_file_scheme_raises(self):
+        with pytest.raises(ValidationError, match="Only HTTP/HTTPS URLs allowed"):
+            URLValidator.validate_url("file:///path/to/file")
+
     def test_validate_url_no_scheme_raises(self):
         with pytest.raises(ValidationError, match="Invalid URL format"):
             URLValidator.validate_url("example.com")
@@ -54,6 +63,35 @@ class TestURLValidator:
         with pytest.raises(ValidationError, match="Invalid URL format"):
             URLValidator.validate_url("https://")
 
+    @pytest.mark.parametrize(
+        "url",
+        ["HTTP://example.com", "HtTpS://example.com:8443/a?b#c", "http://user@host"],
+    )
+    def test_validate_url_accepts_any_scheme_case(self, url):
+        assert URLValidator.validate_url(url) == url
+
+    @pytest.mark.parametrize(
+        "url", ["http:///path", "https://?q=1", "http://#frag", "http:example.com"]
+    )
+    def test_validate_url_empty_host_raises(self, url):
+        with pytest.raises(ValidationError, match="Invalid URL format"):
+            URLValidator.validate_url(url)
+
+    def test_validate_url_control_characters_use_urlparse(self):
+        # urlparse drops tabs before splitting, leaving no host here
+        with pytest.raises(ValidationError, match="Invalid URL format"):
+            URLValidator.validate_url("http://\t/path")
+
+    @pytest.mark.parametrize("url", ["http://a\uff03b@c", "http://exa\u2100mple.com"])
+    def test_validate_url_nfkc_delimiters_use_urlparse(self, url):
+        # These hosts normalize to URL delimiters, which urlparse rejects
+        with pytest.raises(ValueError, match="NFKC"):
+            URLValidator.validate_url(url)
+
+    def test_validate_url_non_ascii_host(self):
+        url = "https://例え.jp/パス"
+        assert URLValidator.validate_url(url) == url
+
 
 class TestFileSizeValidator:
     def test_validate_size_under_limit(self):
@@ -88,10 +126,11 @@ class TestFileSizeValidator:
         with pytest.raises(ValidationError, match="exceeds limit"):
             FileSizeValidator.validate_size(size_bytes, "text/plain", max_size_mb)
 
-    def test_validate_size_zero_or_negative(self):
+    @pytest.mark.parametrize("size_bytes", [0, -1, -(10**9)])
+    @pytest.mark.parametrize("content_type", ["text/plain", "application/pdf", None])
+    def test_validate_size_zero_or_negative(self, size_bytes, content_type):
         # Zero or negative size should be allowed (no validation)
-        FileSizeValidator.validate_size(0, "text/plain")
-        FileSizeValidator.validate_size(-1, "text/plain")
+        FileSizeValidator.validate_size(size_bytes, content_type)
 
 
 class TestContentValidator:
@@ -120,6 +159,20 @@ class TestContentValidator:
         content_type = ContentValidator.detect_content_type(binary_bytes)
         assert content_type == "application/octet-stream"
 
+    @pytest.mark.parametrize(
+        "content,expected",
+        [
+            (b"\xff\xd8\xff\xe0", "image/jpeg"),
+            (b"\xff\xfb\x90\x00", "audio/mp3"),
+            (b"PK\x05\x06", "application/zip"),
+            (b"<!DOCTYPE html>", "text/html"),
+            (b"<?xml version='1.0'?>", "application/xml"),
+        ],
+        ids=["jpeg", "mp3", "empty-zip", "doctype", "xml"],
+    )
+    def test_detect_content_type_shared_first_byte(self, content, expected):
+        assert ContentValidator.detect_content_type(content) == expected
+
     def test_validate_content_type_match(self):
         pdf_bytes = b"%PDF-1.4"
         result = ContentValidator.validate_content_type(pdf_bytes, "application/pdf")
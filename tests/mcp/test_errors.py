@@ -1,5 +1,7 @@
 """Tests for MCP error factories."""
 
+import pytest
+
 from md_server.mcp.errors import (
     ErrorCode,
     timeout_error,
@@ -39,88 +41,134 @@ class TestErrorCode:
             "INVALID_INPUT",
             "UNKNOWN_TOOL",
         ]
-        actual = [code.value for code in ErrorCode]
-        for code in expected:
-            assert code in actual
-
-
-class TestTimeoutError:
-    """Tests for timeout_error factory."""
-
-    def test_creates_error_response(self):
-        """Should create an error response."""
-        result = timeout_error("URL fetch", 60)
+        missing = set(expected) - {code.value for code in ErrorCode}
+        assert not missing, f"missing codes: {missing}"
+
+
+FACTORY_CASES = [
+    pytest.param(
+        timeout_error,
+        ("URL fetch", 60),
+        ["60", "URL fetch"],
+        ErrorCode.TIMEOUT,
+        None,
+        id="timeout",
+    ),
+    pytest.param(
+        connection_error,
+        ("https://example.com", "Connection refused"),
+        ["example.com", "Connection refused"],
+        ErrorCode.CONNECTION_FAILED,
+        None,
+        id="connection",
+    ),
+    pytest.param(
+        not_found_error,
+        ("https://example.com/missing",),
+        [],
+        ErrorCode.NOT_FOUND,
+        404,
+        id="not-found",
+    ),
+    pytest.param(
+        access_denied_error,
+        ("https://example.com/private",),
+        [],
+        ErrorCode.ACCESS_DENIED,
+        403,
+        id="access-denied-default",
+    ),
+    pytest.param(
+        access_denied_error,
+        ("https://example.com/private", 401),
+        [],
+        ErrorCode.ACCESS_DENIED,
+        401,
+        id="access-denied-custom",
+    ),
+    pytest.param(
+        invalid_url_error,
+        ("not-a-url",),
+        ["not-a-url"],
+        ErrorCode.INVALID_URL,
+        None,
+        id="invalid-url",
+    ),
+    pytest.param(
+        unsupported_format_error,
+        (".xyz",),
+        [".xyz"],
+        ErrorCode.UNSUPPORTED_FORMAT,
+        None,
+        id="unsupported-format",
+    ),
+    pytest.param(
+        file_too_large_error,
+        (100.5, 50),
+        ["100", "50"],
+        ErrorCode.FILE_TOO_LARGE,
+        None,
+        id="file-too-large",
+    ),
+    pytest.param(
+        unknown_tool_error,
+        ("bad_tool",),
+        ["bad_tool"],
+        ErrorCode.UNKNOWN_TOOL,
+        None,
+        id="unknown-tool",
+    ),
+    pytest.param(
+        conversion_error,
+        ("File is corrupted",),
+        ["File is corrupted"],
+        ErrorCode.CONVERSION_FAILED,
+        None,
+        id="conversion",
+    ),
+    pytest.param(
+        invalid_input_error,
+        ("Missing required field",),
+        ["Missing required field"],
+        ErrorCode.INVALID_INPUT,
+        None,
+        id="invalid-input",
+    ),
+]
+
+
+class TestErrorFactories:
+    """Shared checks for every error factory."""
+
+    @pytest.mark.parametrize("factory,args,substrings,code,status", FACTORY_CASES)
+    def test_error_factory(self, factory, args, substrings, code, status):
+        """Should build a failed response with the right code, message and status."""
+        result = factory(*args)
         assert result.success is False
-        assert result.error.code == ErrorCode.TIMEOUT
-
-    def test_includes_timeout_in_message(self):
-        """Message should include the timeout value."""
-        result = timeout_error("URL fetch", 60)
-        assert "60" in result.error.message
-
-    def test_includes_operation_in_message(self):
-        """Message should include the operation name."""
-        result = timeout_error("File conversion", 30)
-        assert "File conversion" in result.error.message
-
-    def test_has_suggestions(self):
-        """Should include helpful suggestions."""
-        result = timeout_error("URL fetch", 60)
-        assert len(result.error.suggestions) > 0
-
-
-class TestConnectionError:
-    """Tests for connection_error factory."""
-
-    def test_includes_url_in_message(self):
-        """Message should include the URL."""
-        result = connection_error("https://example.com", "Connection refused")
-        assert "example.com" in result.error.message
-
-    def test_includes_reason_in_message(self):
-        """Message should include the reason."""
-        result = connection_error("https://example.com", "Connection refused")
-        assert "Connection refused" in result.error.message
-
-    def test_has_suggestions(self):
+        assert result.error.code == code
+        for text in substrings:
+            assert text in result.error.message
+        if status is not None:
+            assert result.error.details is not None
+            assert result.error.details.status_code == status
+
+    @pytest.mark.parametrize(
+        "factory,args",
+        [
+            (timeout_error, ("URL fetch", 60)),
+            (connection_error, ("https://example.com", "Timeout")),
+            (conversion_error, ("Error",)),
+        ],
+        ids=["timeout", "connection", "conversion"],
+    )
+    def test_has_suggestions(self, factory, args):
         """Should include helpful suggestions."""
-        result = connection_error("https://example.com", "Timeout")
-        assert len(result.error.suggestions) > 0
-
-
-class TestNotFoundError:
-    """Tests for not_found_error factory."""
-
-    def test_has_404_status_code(self):
-        """Should include 404 status code in details."""
-        result = not_found_error("https://example.com/missing")
-        assert result.error.details is not None
-        assert result.error.details.status_code == 404
-
-
-class TestAccessDeniedError:
-    """Tests for access_denied_error factory."""
-
-    def test_default_403_status_code(self):
-        """Should default to 403 status code."""
-        result = access_denied_error("https://example.com/private")
-        assert result.error.details is not None
-        assert result.error.details.status_code == 403
-
-    def test_custom_status_code(self):
-        """Should accept custom status code."""
-        result = access_denied_error("https://example.com/private", 401)
-        assert result.error.details.status_code == 401
+        assert len(factory(*args).error.suggestions) > 0
 
 
 class TestInvalidUrlError:
     """Tests for invalid_url_error factory."""
 
-    def test_includes_url_in_message(self):
-        """Message should include the invalid URL."""
-        result = invalid_url_error("not-a-url")
-        assert "not-a-url" in result.error.message
-
     def test_suggests_correct_format(self):
         """Suggestions should mention correct URL format."""
         result = invalid_url_error("bad")
@@ -131,11 +179,6 @@ class TestInvalidUrlError:
 class TestUnsupportedFormatError:
     """Tests for unsupported_format_error factory."""
 
-    def test_includes_extension_in_message(self):
-        """Message should include the unsupported extension."""
-        result = unsupported_format_error(".xyz")
-        assert ".xyz" in result.error.message
-
     def test_lists_supported_formats(self):
         """Suggestions should list supported formats."""
         result = unsupported_format_error(".xyz")
@@ -150,16 +193,6 @@ class TestUnsupportedFormatError:
         assert "pdf" in suggestions_text.lower()
 
 
-class TestFileTooLargeError:
-    """Tests for file_too_large_error factory."""
-
-    def test_includes_sizes_in_message(self):
-        """Message should include both file size and max size."""
-        result = file_too_large_error(100.5, 50)
-        assert "100" in result.error.message
-        assert "50" in result.error.message
-
-
 class TestContentEmptyError:
     """Tests for content_empty_error factory."""
 
@@ -179,36 +212,8 @@ class TestContentEmptyError:
 class TestUnknownToolError:
     """Tests for unknown_tool_error factory."""
 
-    def test_includes_tool_name_in_message(self):
-        """Message should include the unknown tool name."""
-        result = unknown_tool_error("bad_tool")
-        assert "bad_tool" in result.error.message
-
     def test_lists_available_tools(self):
         """Suggestions should list available tools."""
         result = unknown_tool_error("bad_tool")
         suggestions_text = " ".join(result.error.suggestions)
         assert "convert_to_markdown" in suggestions_text
-
-
-class TestConversionError:
-    """Tests for conversion_error factory."""
-
-    def test_includes_message(self):
-        """Should include the error message."""
-        result = conversion_error("File is corrupted")
-        assert "File is corrupted" in result.error.message
-
-    def test_has_suggestions(self):
-        """Should include helpful suggestions."""
-        result = conversion_error("Error")
-        assert len(result.error.suggestions) > 0
-
-
-class TestInvalidInputError:
-    """Tests for invalid_input_error factory."""
-
-    def test_includes_message(self):
-        """Should include the error message."""
-        result = invalid_input_error("Missing required field")
-        assert "Missing required field" in result.error.message
@@ -49,7 +49,6 @@ def mock_conversion_result():
 class TestHandleReadResourceInputValidation:
     """Tests for handle_read_resource input validation."""
 
-    @pytest.mark.asyncio
     async def test_error_when_both_url_and_file_content(self, mock_converter):
         """Should return error when both url and file_content are provided."""
         result = await handle_read_resource(
@@ -63,7 +62,6 @@ class TestHandleReadResourceInputValidation:
         assert result.error.code == ErrorCode.INVALID_INPUT
         assert "not both" in result.error.message
 
-    @pytest.mark.asyncio
     async def test_error_when_neither_url_nor_file_content(self, mock_converter):
         """Should return error when neither url nor file_content is provided."""
         result = await handle_read_resource(mock_converter)
@@ -75,7 +73,6 @@ class TestHandleReadResourceInputValidation:
             or "file_content" in result.error.message.lower()
         )
 
-    @pytest.mark.asyncio
     async def test_error_when_file_content_without_filename(self, mock_converter):
         """Should return error when file_content is provided without filename."""
         result = await handle_read_resource(
@@ -87,7 +84,6 @@ class TestHandleReadResourceInputValidation:
         assert result.error.code == ErrorCode.INVALID_INPUT
         assert "filename" in result.error.message.lower()
 
-    @pytest.mark.asyncio
     async def test_render_js_silently_ignored_for_file(
         self, mock_converter, mock_conversion_result
     ):
@@ -115,7 +111,6 @@ class TestHandleReadResourceUrl:
 
     # --- Output Format Tests (table-driven) ---
 
-    @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "output_format,expected_type,check_field",
         [
@@ -148,7 +143,6 @@ class TestHandleReadResourceUrl:
         if check_field:
             assert getattr(result, check_field) is True
 
-    @pytest.mark.asyncio
     async def test_error_always_json(self, mock_converter):
         """Error responses should always be JSON regardless of output_format."""
         result = await handle_read_resource(
@@ -163,7 +157,6 @@ class TestHandleReadResourceUrl:
 
     # --- Invalid URL Tests (table-driven) ---
 
-    @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "url",
         [
@@ -181,7 +174,6 @@ class TestHandleReadResourceUrl:
 
     # --- Error Handling Tests (table-driven) ---
 
-    @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "exception,expected_code",
         [
@@ -225,7 +217,6 @@ class TestHandleReadResourceUrl:
         assert isinstance(result, MCPErrorResponse)
         assert result.error.code == expected_code
 
-    @pytest.mark.asyncio
     async def test_empty_content(self, mock_converter):
         """Should return content empty error for minimal content."""
         mock_result = MagicMock()
@@ -244,7 +235,6 @@ class TestHandleReadResourceUrl:
 
     # --- Parameter Passing Tests (table-driven) ---
 
-    @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "param_name,param_value,converter_key",
         [
@@ -274,7 +264,6 @@ class TestHandleReadResourceUrl:
         call_kwargs = mock_converter.convert_url.call_args.kwargs
         assert call_kwargs[converter_key] == param_value
 
-    @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "param_name",
         ["max_length", "max_tokens", "timeout", "truncate_mode", "truncate_limit"],
@@ -292,7 +281,6 @@ class TestHandleReadResourceUrl:
         call_kwargs = mock_converter.convert_url.call_args.kwargs
         assert param_name not in call_kwargs
 
-    @pytest.mark.asyncio
     async def test_render_js_passed_to_converter(
         self, mock_converter, mock_conversion_result
     ):
@@ -307,7 +295,6 @@ class TestHandleReadResourceUrl:
         call_kwargs = mock_converter.convert_url.call_args.kwargs
         assert call_kwargs["js_rendering"] is True
 
-    @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "include_frontmatter,expected",
         [(True, True), (False, False)],
@@ -329,7 +316,6 @@ class TestHandleReadResourceUrl:
         call_kwargs = mock_converter.convert_url.call_args.kwargs
         assert call_kwargs["include_frontmatter"] is expected
 
-    @pytest.mark.asyncio
     async def test_include_frontmatter_default_true(
         self, mock_converter, mock_conversion_result
     ):
@@ -342,7 +328,6 @@ class TestHandleReadResourceUrl:
         call_kwargs = mock_converter.convert_url.call_args.kwargs
         assert call_kwargs["include_frontmatter"] is True
 
-    @pytest.mark.asyncio
     async def test_word_count_calculated(self, mock_converter, mock_conversion_result):
         """Should calculate word count from content (JSON format)."""
         mock_converter.convert_url = AsyncMock(return_value=mock_conversion_result)
@@ -361,7 +346,6 @@ class TestHandleReadResourceFile:
 
     # --- Output Format Tests (table-driven) ---
 
-    @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "output_format,expected_type",
         [
@@ -387,7 +371,6 @@ class TestHandleReadResourceFile:
 
         assert isinstance(result, expected_type)
 
-    @pytest.mark.asyncio
     async def test_error_always_json(self, mock_converter):
         """Error responses should always be JSON regardless of output_format."""
         mock_converter.max_file_size_mb = 1
@@ -405,7 +388,6 @@ class TestHandleReadResourceFile:
 
     # --- OCR Auto-Enable Tests (table-driven) ---
 
-    @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "filename,should_ocr",
         [
@@ -434,7 +416,6 @@ class TestHandleReadResourceFile:
 
     # --- Parameter Passing Tests (table-driven) ---
 
-    @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "param_name,param_value,converter_key",
         [
@@ -466,7 +447,6 @@ class TestHandleReadResourceFile:
         call_kwargs = mock_converter.convert_content.call_args.kwargs
         assert call_kwargs[converter_key] == param_value
 
-    @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "param_name",
         ["max_length", "max_tokens", "timeout", "truncate_mode", "truncate_limit"],
@@ -486,7 +466,6 @@ class TestHandleReadResourceFile:
         call_kwargs = mock_converter.convert_content.call_args.kwargs
         assert param_name not in call_kwargs
 
-    @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "include_frontmatter,expected",
         [(True, True), (False, False)],
@@ -509,7 +488,6 @@ class TestHandleReadResourceFile:
         call_kwargs = mock_converter.convert_content.call_args.kwargs
         assert call_kwargs["include_frontmatter"] is expected
 
-    @pytest.mark.asyncio
     async def test_include_frontmatter_default_true(
         self, mock_converter, mock_conversion_result
     ):
@@ -526,7 +504,6 @@ class TestHandleReadResourceFile:
 
     # --- Error Handling Tests (table-driven) ---
 
-    @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "exception,expected_code",
         [
@@ -555,7 +532,6 @@ class TestHandleReadResourceFile:
         assert isinstance(result, MCPErrorResponse)
         assert result.error.code == expected_code
 
-    @pytest.mark.asyncio
     async def test_file_too_large(self, mock_converter):
         """Should return error for files exceeding size limit."""
         mock_converter.max_file_size_mb = 1
@@ -570,7 +546,6 @@ class TestHandleReadResourceFile:
 
     # --- Metadata Tests ---
 
-    @pytest.mark.asyncio
     async def test_ocr_applied_in_metadata(
         self, mock_converter, mock_conversion_result
     ):
@@ -587,7 +562,6 @@ class TestHandleReadResourceFile:
         assert isinstance(result, MCPSuccessResponse)
         assert result.metadata.ocr_applied is True
 
-    @pytest.mark.asyncio
     async def test_source_is_filename(self, mock_converter, mock_conversion_result):
         """Should use filename as source (JSON format)."""
         mock_converter.convert_content = AsyncMock(return_value=mock_conversion_result)
@@ -614,7 +588,6 @@ class TestHandleReadResourceSsrf:
         converter.timeout = 60
         return converter
 
-    @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "error_message,expected_code",
         [
@@ -7,27 +7,24 @@ from unittest.mock import patch, AsyncMock, MagicMock
 
 from mcp.server.fastmcp.exceptions import ToolError
 
+from md_server.mcp.errors import unknown_tool_error
+from md_server.mcp.server import convert_to_markdown, mcp
+
 
 @pytest.mark.unit
 class TestMCPServerIntegration:
     """Integration tests for MCP server tool calls."""
 
-    @pytest.mark.asyncio
     async def test_tool_is_registered(self):
         """Tool listing should include convert_to_markdown."""
-        from md_server.mcp.server import mcp
-
         tools = await mcp.list_tools()
         names = [t.name for t in tools]
 
         assert "convert_to_markdown" in names
         assert len(tools) == 1
 
-    @pytest.mark.asyncio
     async def test_convert_url_success(self):
         """convert_to_markdown should handle url successfully."""
-        from md_server.mcp.server import convert_to_markdown
-
         with patch("md_server.mcp.server.get_converter") as mock_get:
             mock_conv = MagicMock()
             mock_conv.timeout = 60
@@ -55,11 +52,8 @@ class TestMCPServerIntegration:
             assert data["success"] is True
             assert data["title"] == "Test Page"
 
-    @pytest.mark.asyncio
     async def test_convert_with_render_js(self):
         """convert_to_markdown should pass render_js to handler."""
-        from md_server.mcp.server import convert_to_markdown
-
         with patch("md_server.mcp.server.get_converter") as mock_get:
             mock_conv = MagicMock()
             mock_conv.timeout = 60
@@ -76,11 +70,8 @@ class TestMCPServerIntegration:
             call_kwargs = mock_conv.convert_url.call_args.kwargs
             assert call_kwargs["js_rendering"] is True
 
-    @pytest.mark.asyncio
     async def test_convert_file_success(self):
         """convert_to_markdown should handle file_content successfully."""
-        from md_server.mcp.server import convert_to_markdown
-
         with patch("md_server.mcp.server.get_converter") as mock_get:
             mock_conv = MagicMock()
             mock_conv.timeout = 60
@@ -115,28 +106,19 @@ class TestMCPServerIntegration:
 
     # --- Input Validation Error Tests ---
 
-    @pytest.mark.asyncio
     async def test_error_missing_input(self):
         """Should raise ToolError when no input provided."""
-        from md_server.mcp.server import convert_to_markdown
-
         with pytest.raises(ToolError):
             await convert_to_markdown()
 
-    @pytest.mark.asyncio
     async def test_error_missing_filename(self):
         """Should raise ToolError when file_content without filename."""
-        from md_server.mcp.server import convert_to_markdown
-
         content = base64.b64encode(b"data").decode()
         with pytest.raises(ToolError):
             await convert_to_markdown(file_content=content)
 
-    @pytest.mark.asyncio
     async def test_error_both_inputs(self):
         """Should raise ToolError when both url and file_content provided."""
-        from md_server.mcp.server import convert_to_markdown
-
         content = base64.b64encode(b"data").decode()
         with pytest.raises(ToolError):
             await convert_to_markdown(
@@ -145,22 +127,16 @@ class TestMCPServerIntegration:
                 filename="test.pdf",
             )
 
-    @pytest.mark.asyncio
     async def test_error_invalid_base64(self):
         """Should raise ToolError for invalid base64."""
-        from md_server.mcp.server import convert_to_markdown
-
         with pytest.raises(ToolError, match="base64"):
             await convert_to_markdown(
                 file_content="not-valid-base64!!!",
                 filename="test.pdf",
             )
 
-    @pytest.mark.asyncio
     async def test_unknown_tool_error_suggests_convert(self):
         """Unknown tool error should suggest convert_to_markdown."""
-        from md_server.mcp.errors import unknown_tool_error
-
         result = unknown_tool_error("bad_tool")
         assert "convert_to_markdown" in str(result.error.suggestions)
 
@@ -169,11 +145,8 @@ class TestMCPServerIntegration:
 class TestMCPResponseFormat:
     """Tests for MCP response format consistency."""
 
-    @pytest.mark.asyncio
     async def test_success_response_structure(self):
         """Success responses (JSON format) should have consistent structure."""
-        from md_server.mcp.server import convert_to_markdown
-
         with patch("md_server.mcp.server.get_converter") as mock_get:
             mock_conv = MagicMock()
             mock_conv.timeout = 60
@@ -206,10 +179,7 @@ class TestMCPResponseFormat:
             assert "word_count" in data
             assert "metadata" in data
 
-    @pytest.mark.asyncio
     async def test_error_raises_tool_error(self):
         """Errors should raise ToolError (not return JSON error response)."""
-        from md_server.mcp.server import convert_to_markdown
-
         with pytest.raises(ToolError):
             await convert_to_markdown()
@@ -4,10 +4,11 @@ import base64
 import json
 import logging
 import pytest
-from unittest.mock import patch, Mock, AsyncMock, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 
 from mcp.server.fastmcp.exceptions import ToolError
 
+from md_server.core.config import Settings
 from md_server.mcp.server import convert_to_markdown, get_converter, mcp
 
 
@@ -21,27 +22,23 @@ async def _get_tool():
 class TestMCPServer:
     """Test MCP server functionality."""
 
-    @pytest.mark.asyncio
     async def test_tool_is_registered(self):
         """convert_to_markdown should be registered as a tool."""
         tools = await mcp.list_tools()
         names = [t.name for t in tools]
         assert "convert_to_markdown" in names
 
-    @pytest.mark.asyncio
     async def test_tool_has_no_output_schema(self):
         """Tool should not have an output schema (avoids Claude Code bug)."""
         tool = await _get_tool()
         assert tool.outputSchema is None
 
-    @pytest.mark.asyncio
     async def test_tool_has_readonly_annotation(self):
         """Tool should have readOnlyHint annotation."""
         tool = await _get_tool()
         assert tool.annotations is not None
         assert tool.annotations.readOnlyHint is True
 
-    @pytest.mark.asyncio
     async def test_tool_has_expected_parameters(self):
         """Tool should have all expected input parameters."""
         tool = await _get_tool()
@@ -62,7 +59,6 @@ class TestMCPServer:
         for param in expected:
             assert param in props, f"missing parameter: {param}"
 
-    @pytest.mark.asyncio
     async def test_tool_has_output_format_default(self):
         """Tool should have output_format with default 'markdown'."""
         tool = await _get_tool()
@@ -72,7 +68,6 @@ class TestMCPServer:
 
     # --- Output Format Tests ---
 
-    @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "output_format,is_json",
         [
@@ -116,7 +111,6 @@ class TestMCPServer:
             else:
                 assert result.startswith("# Hello World")
 
-    @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "output_format,is_json",
         [
@@ -165,7 +159,6 @@ class TestMCPServer:
 
     # --- Parameter Passing Tests ---
 
-    @pytest.mark.asyncio
     async def test_url_passes_new_options(self):
         """convert_to_markdown with url should pass options to handler."""
         with patch("md_server.mcp.server.get_converter") as mock_get:
@@ -192,7 +185,6 @@ class TestMCPServer:
             assert call_kwargs["timeout"] == 30
             assert call_kwargs["include_frontmatter"] is False
 
-    @pytest.mark.asyncio
     async def test_file_passes_new_options(self):
         """convert_to_markdown with file_content should pass options to handler."""
         with patch("md_server.mcp.server.get_converter") as mock_get:
@@ -229,19 +221,13 @@ class TestMCPServer:
 
     # --- Error Handling Tests ---
 
-    @pytest.mark.asyncio
     async def test_error_missing_input(self):
         """Should raise ToolError when neither url nor file_content provided."""
-        from mcp.server.fastmcp.exceptions import ToolError
-
         with pytest.raises(ToolError):
             await convert_to_markdown()
 
-    @pytest.mark.asyncio
     async def test_error_both_inputs(self):
         """Should raise ToolError when both url and file_content provided."""
-        from mcp.server.fastmcp.exceptions import ToolError
-
         content = base64.b64encode(b"data").decode()
         with pytest.raises(ToolError):
             await convert_to_markdown(
@@ -250,20 +236,14 @@ class TestMCPServer:
                 filename="test.pdf",
             )
 
-    @pytest.mark.asyncio
     async def test_error_missing_filename(self):
         """Should raise ToolError when file_content without filename."""
-        from mcp.server.fastmcp.exceptions import ToolError
-
         content = base64.b64encode(b"data").decode()
         with pytest.raises(ToolError):
             await convert_to_markdown(file_content=content)
 
-    @pytest.mark.asyncio
     async def test_error_invalid_base64(self):
         """Should raise ToolError for invalid base64."""
-        from mcp.server.fastmcp.exceptions import ToolError
-
         with pytest.raises(ToolError, match="base64"):
             await convert_to_markdown(
                 file_content="not-valid-base64!!!", filename="test.pdf"
@@ -277,7 +257,7 @@ class TestMCPTransports:
     def test_get_converter_uses_settings(self):
         """Verify converter is created with correct settings."""
         with patch("md_server.mcp.server.get_settings") as mock_settings:
-            mock_settings.return_value = Mock(
+            mock_settings.return_value = Settings(
                 conversion_timeout=60,
                 max_file_size=100 * 1024 * 1024,  # 100MB
             )
@@ -290,7 +270,6 @@ class TestMCPTransports:
 class TestBase64SizeValidation:
     """Tests for base64 pre-decode size estimation."""
 
-    @pytest.mark.asyncio
     async def test_oversized_base64_rejected(self):
         """Should reject base64 input that would exceed max file size."""
         # Create a base64 string that decodes to ~75 bytes
@@ -298,14 +277,13 @@ class TestBase64SizeValidation:
         large_b64 = base64.b64encode(b"x" * 100).decode()
 
         with patch("md_server.mcp.server.get_settings") as mock_settings:
-            mock_settings.return_value = Mock(
+            mock_settings.return_value = Settings(
                 max_file_size=10,  # 10 bytes limit
                 conversion_timeout=60,
             )
             with pytest.raises(ToolError, match="File too large"):
                 await convert_to_markdown(file_content=large_b64, filename="test.pdf")
 
-    @pytest.mark.asyncio
     async def test_base64_just_under_limit(self):
         """Should accept base64 input just under the size limit."""
         small_content = b"x" * 10
@@ -315,7 +293,7 @@ class TestBase64SizeValidation:
             patch("md_server.mcp.server.get_converter") as mock_get,
             patch("md_server.mcp.server.get_settings") as mock_settings,
         ):
-            mock_settings.return_value = Mock(
+            mock_settings.return_value = Settings(
                 max_file_size=1024 * 1024,  # 1MB
                 conversion_timeout=60,
             )
@@ -344,7 +322,6 @@ class TestBase64SizeValidation:
 class TestLogging:
     """Tests for logging output during tool invocation."""
 
-    @pytest.mark.asyncio
     async def test_successful_conversion_logs(self, caplog):
         """Should log invocation start and success with duration."""
         with patch("md_server.mcp.server.get_converter") as mock_get:
@@ -367,7 +344,6 @@ class TestLogging:
             assert "duration_ms=" in log_text
             assert "success" in log_text
 
-    @pytest.mark.asyncio
     async def test_error_conversion_logs(self, caplog):
         """Should log error with duration on failure."""
         with caplog.at_level(logging.WARNING, logger="md_server.mcp.server"):
@@ -382,7 +358,6 @@ class TestLogging:
 class TestTruncation:
     """Tests for truncation parameters through the MCP tool function."""
 
-    @pytest.mark.asyncio
     async def test_max_tokens_passed_to_converter(self):
         """max_tokens should be passed through to the converter."""
         with patch("md_server.mcp.server.get_converter") as mock_get:
@@ -414,7 +389,6 @@ class TestTruncation:
             assert data["metadata"]["was_truncated"] is True
             assert data["metadata"]["truncation_mode"] == "tokens"
 
-    @pytest.mark.asyncio
     async def test_truncate_limit_passed_to_converter(self):
         """truncate_limit and truncate_mode should be passed through."""
         with patch("md_server.mcp.server.get_converter") as mock_get:
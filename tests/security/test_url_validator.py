@@ -1,5 +1,6 @@
 """Unit tests for SSRF protection."""
 
+import ipaddress
 import pytest
 from unittest.mock import patch
 import socket
@@ -177,34 +178,24 @@ class TestNetworkConfiguration:
 
     def test_loopback_networks_contains_ipv4(self):
         """Loopback networks includes IPv4 loopback."""
-        import ipaddress
-
         assert ipaddress.ip_network("127.0.0.0/8") in LOOPBACK_NETWORKS
 
     def test_loopback_networks_contains_ipv6(self):
         """Loopback networks includes IPv6 loopback."""
-        import ipaddress
-
         assert ipaddress.ip_network("::1/128") in LOOPBACK_NETWORKS
 
     def test_private_networks_contains_rfc1918(self):
         """Private networks includes RFC 1918 ranges."""
-        import ipaddress
-
         assert ipaddress.ip_network("10.0.0.0/8") in PRIVATE_NETWORKS
         assert ipaddress.ip_network("172.16.0.0/12") in PRIVATE_NETWORKS
         assert ipaddress.ip_network("192.168.0.0/16") in PRIVATE_NETWORKS
 
     def test_dangerous_networks_contains_link_local(self):
         """Dangerous networks includes link-local (cloud metadata)."""
-        import ipaddress
-
         assert ipaddress.ip_network("169.254.0.0/16") in DANGEROUS_NETWORKS
 
     def test_dangerous_networks_contains_zero_network(self):
         """Dangerous networks includes 0.0.0.0/8."""
-        import ipaddress
-
         assert ipaddress.ip_network("0.0.0.0/8") in DANGEROUS_NETWORKS
 
 
@@ -1,24 +1,27 @@
 import pytest
 import base64
+from litestar import Litestar, get
+from litestar.di import Provide
+from litestar.response import Response
+from litestar.status_codes import HTTP_200_OK
 from litestar.testing import TestClient
 
-from md_server.app import app
-from tests.test_server.server import TestHTTPServer
+from md_server.app import (
+    app,
+    build_middleware,
+    provide_converter,
+    provide_document_converter,
+)
+from md_server.controllers import ConvertController
+from md_server.core.config import Settings
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
+    # Not entered as a context manager, so on_startup browser detection never runs
     return TestClient(app)
 
 
-@pytest.fixture
-def test_server():
-    server = TestHTTPServer()
-    server.start()
-    yield server
-    server.stop()
-
-
 class TestHealthEndpoint:
     def test_health_check(self, client):
         response = client.get("/healthz")
@@ -69,16 +72,14 @@ class TestConvertUnifiedEndpoint:
         # This might fail in CI without internet, so accept either success or failure
         assert response.status_code in [200, 500, 422]
 
-    def test_convert_file_multipart(self, client, simple_html_file):
-        if simple_html_file.exists():
-            with open(simple_html_file, "rb") as f:
-                response = client.post(
-                    "/convert", files={"file": ("test.html", f, "text/html")}
-                )
-            assert response.status_code == 200
-            data = response.json()
-            assert data["success"] is True
-            assert data["markdown"]
+    def test_convert_file_multipart(self, client, simple_html_bytes):
+        response = client.post(
+            "/convert", files={"file": ("test.html", simple_html_bytes, "text/html")}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["markdown"]
 
     def test_convert_binary_upload(self, client):
         html_content = "<html><body><h1>Binary</h1></body></html>"
@@ -96,16 +97,13 @@ class TestConvertUnifiedEndpoint:
 class TestInvalidPayloadHandling:
     """Test error handling for invalid payloads"""
 
-    def test_convert_empty_content(self, client):
-        response = client.post("/convert", json={"content": ""})
-        assert response.status_code in [400, 422]
-
-    def test_convert_invalid_url(self, client):
-        response = client.post("/convert", json={"url": "not-a-url"})
-        assert response.status_code in [400, 422]
-
-    def test_convert_no_input_provided(self, client):
-        response = client.post("/convert", json={})
+    @pytest.mark.parametrize(
+        "payload",
+        [{"content": ""}, {"url": "not-a-url"}, {}],
+        ids=["empty-content", "invalid-url", "no-input"],
+    )
+    def test_convert_rejected_payload(self, client, payload):
+        response = client.post("/convert", json=payload)
         assert response.status_code in [400, 422]
 
     def test_convert_invalid_json(self, client):
@@ -309,23 +307,9 @@ class TestAuthenticationIntegration:
 
     def create_app_with_auth(self, api_key):
         """Create app instance with authentication enabled"""
-        from litestar import Litestar, get
-        from litestar.di import Provide
-        from litestar.response import Response
-        from litestar.status_codes import HTTP_200_OK
-        from md_server.controllers import ConvertController
-        from md_server.core.config import Settings
-        from md_server.middleware.auth import create_auth_middleware
-        from md_server.app import provide_converter, provide_document_converter
-
         # Create settings with API key
         settings = Settings(api_key=api_key)
-
-        # Create middleware
-        middleware = []
-        auth_middleware_class = create_auth_middleware(settings)
-        if auth_middleware_class:
-            middleware.append(auth_middleware_class)
+        middleware = build_middleware(settings)
 
         @get("/health")
         async def health() -> Response:
@@ -786,17 +770,15 @@ class TestContentNegotiation:
         # Error responses should be JSON
         assert response.status_code >= 400
 
-    def test_markdown_response_with_multipart(self, client, simple_html_file):
+    def test_markdown_response_with_multipart(self, client, simple_html_bytes):
         """Multipart uploads also support content negotiation."""
-        if simple_html_file.exists():
-            with open(simple_html_file, "rb") as f:
-                response = client.post(
-                    "/convert",
-                    files={"file": ("test.html", f, "text/html")},
-                    headers={"Accept": "text/markdown"},
-                )
-            assert response.status_code == 200
-            assert "text/markdown" in response.headers["content-type"]
+        response = client.post(
+            "/convert",
+            files={"file": ("test.html", simple_html_bytes, "text/html")},
+            headers={"Accept": "text/markdown"},
+        )
+        assert response.status_code == 200
+        assert "text/markdown" in response.headers["content-type"]
 
     def test_markdown_with_charset_in_accept(self, client):
         """Accept: text/markdown; charset=utf-8 works."""
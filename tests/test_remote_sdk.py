@@ -29,7 +29,6 @@ class TestRemoteMDConverter:
         converter = RemoteMDConverter("http://localhost:9011/")
         assert converter.endpoint == "http://localhost:9011"
 
-    @pytest.mark.asyncio
     async def test_convert_content_success(self, remote_converter):
         mock_response = Mock()
         mock_response.json.return_value = {
@@ -45,7 +44,6 @@ class TestRemoteMDConverter:
             assert result.markdown == "# Test Content"
             mock_post.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_convert_content_http_error(self, remote_converter):
         with patch("httpx.AsyncClient.post") as mock_post:
             mock_post.side_effect = httpx.HTTPStatusError(
@@ -55,7 +53,6 @@ class TestRemoteMDConverter:
             with pytest.raises(httpx.HTTPStatusError):
                 await remote_converter.convert_content(b"<h1>Test</h1>")
 
-    @pytest.mark.asyncio
     async def test_convert_content_network_error(self, remote_converter):
         with patch("httpx.AsyncClient.post") as mock_post:
             mock_post.side_effect = httpx.ConnectError("Connection failed")
@@ -63,7 +60,6 @@ class TestRemoteMDConverter:
             with pytest.raises(httpx.ConnectError):
                 await remote_converter.convert_content(b"<h1>Test</h1>")
 
-    @pytest.mark.asyncio
     async def test_convert_url_success(self, remote_converter):
         mock_response = Mock()
         mock_response.json.return_value = {
@@ -78,7 +74,6 @@ class TestRemoteMDConverter:
             assert result.success is True
             assert result.markdown == "# URL Content"
 
-    @pytest.mark.asyncio
     async def test_convert_file_success(self, remote_converter, simple_html_file):
         if simple_html_file.exists():
             mock_response = Mock()
@@ -94,7 +89,6 @@ class TestRemoteMDConverter:
                 assert result.success is True
                 assert result.markdown == "# File Content"
 
-    @pytest.mark.asyncio
     async def test_convert_file_nonexistent(self, remote_converter):
         from pathlib import Path
 
@@ -145,7 +139,6 @@ class TestRemoteMDConverter:
                 assert result.success is True
                 assert result.markdown == "# Sync File"
 
-    @pytest.mark.asyncio
     async def test_headers_with_api_key(self):
         converter = RemoteMDConverter("http://localhost:9011", api_key="test-key")
 
@@ -163,24 +156,20 @@ class TestRemoteMDConverter:
 
     # --- URL Validation Tests ---
 
-    @pytest.mark.asyncio
     async def test_convert_url_empty_raises(self, remote_converter):
         with pytest.raises(ValueError, match="URL cannot be empty"):
             await remote_converter.convert_url("")
 
-    @pytest.mark.asyncio
     async def test_convert_url_whitespace_raises(self, remote_converter):
         with pytest.raises(ValueError, match="URL cannot be empty"):
             await remote_converter.convert_url("   ")
 
-    @pytest.mark.asyncio
     async def test_convert_url_invalid_scheme_raises(self, remote_converter):
         with pytest.raises(ValueError, match="must start with http"):
             await remote_converter.convert_url("ftp://example.com")
 
     # --- raw_markdown Tests ---
 
-    @pytest.mark.asyncio
     async def test_convert_url_raw_markdown(self, remote_converter):
         mock_response = Mock()
         mock_response.text = "# Raw Content"
@@ -193,7 +182,6 @@ class TestRemoteMDConverter:
             assert result == "# Raw Content"
             assert isinstance(result, str)
 
-    @pytest.mark.asyncio
     async def test_convert_content_raw_markdown(self, remote_converter):
         mock_response = Mock()
         mock_response.text = "# Raw Content"
@@ -206,7 +194,6 @@ class TestRemoteMDConverter:
 
     # --- convert_text Method Tests ---
 
-    @pytest.mark.asyncio
     async def test_convert_text_success(self, remote_converter):
         mock_response = Mock()
         mock_response.json.return_value = {
@@ -221,12 +208,10 @@ class TestRemoteMDConverter:
             assert result.success is True
             assert result.markdown == "# Text Content"
 
-    @pytest.mark.asyncio
     async def test_convert_text_empty_raises(self, remote_converter):
         with pytest.raises(ValueError, match="Text cannot be empty"):
             await remote_converter.convert_text("")
 
-    @pytest.mark.asyncio
     async def test_convert_text_raw_markdown(self, remote_converter):
         mock_response = Mock()
         mock_response.text = "# Raw Text"
@@ -253,7 +238,6 @@ class TestRemoteMDConverter:
 
     # --- Content Validation Tests ---
 
-    @pytest.mark.asyncio
     async def test_convert_content_empty_raises(self, remote_converter):
         with pytest.raises(ValueError, match="Content cannot be empty"):
             await remote_converter.convert_content(b"")
@@ -262,7 +246,6 @@ class TestRemoteMDConverter:
 class TestRemoteMDConverterTimeout:
     """Test timeout handling in remote converter"""
 
-    @pytest.mark.asyncio
     async def test_timeout_error_handling(self):
         converter = RemoteMDConverter("http://localhost:9011", timeout=0.001)
 
@@ -272,7 +255,6 @@ class TestRemoteMDConverterTimeout:
             with pytest.raises(httpx.TimeoutException):
                 await converter.convert_content(b"<h1>Test</h1>")
 
-    @pytest.mark.asyncio
     async def test_invalid_json_response(self):
         """Test handling of invalid JSON response"""
         converter = RemoteMDConverter("http://localhost:9011")
@@ -285,7 +267,6 @@ class TestRemoteMDConverterTimeout:
             with pytest.raises(ValueError):
                 await converter.convert_content(b"<h1>Test</h1>")
 
-    @pytest.mark.asyncio
     async def test_malformed_response_structure(self):
         """Test handling of malformed response structure"""
         converter = RemoteMDConverter("http://localhost:9011")
@@ -304,7 +285,6 @@ class TestRemoteMDConverterTimeout:
 
 
 class TestRemoteMDConverterContextManager:
-    @pytest.mark.asyncio
     async def test_async_context_manager(self):
         async with RemoteMDConverter("http://localhost:9011") as converter:
             assert converter is not None
@@ -318,7 +298,6 @@ class TestRemoteMDConverterContextManager:
 class TestRemoteMDConverterAppLifecycle:
     """Test app startup/shutdown lifecycle paths"""
 
-    @pytest.mark.asyncio
     async def test_client_session_lifecycle(self):
         """Test proper client session management"""
         converter = RemoteMDConverter("http://localhost:9011")
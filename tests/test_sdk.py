@@ -21,7 +21,6 @@ class TestMDConverter:
         assert converter._converter.js_rendering is True
         assert converter._converter.timeout == 60
 
-    @pytest.mark.asyncio
     async def test_convert_file_async(self, converter, simple_html_file):
         if simple_html_file.exists():
             result = await converter.convert_file(simple_html_file)
@@ -36,13 +35,11 @@ class TestMDConverter:
             assert result.success is True
             assert result.markdown
 
-    @pytest.mark.asyncio
     async def test_convert_file_nonexistent(self, converter):
         nonexistent = Path("/nonexistent/file.txt")
         with pytest.raises(FileNotFoundError):
             await converter.convert_file(nonexistent)
 
-    @pytest.mark.asyncio
     async def test_convert_content_async(self, converter):
         content = b"<html><body><h1>Test Content</h1></body></html>"
         result = await converter.convert_content(content)
@@ -57,14 +54,12 @@ class TestMDConverter:
         assert result.success is True
         assert "Test Content" in result.markdown
 
-    @pytest.mark.asyncio
     async def test_convert_content_empty(self, converter):
         from markitdown._exceptions import UnsupportedFormatException
 
         with pytest.raises(UnsupportedFormatException):
             await converter.convert_content(b"")
 
-    @pytest.mark.asyncio
     async def test_convert_url_async(self, converter):
         from md_server.models import ConversionMetadata
 
@@ -101,14 +96,12 @@ class TestMDConverter:
             assert result.success is True
             assert result.markdown == "# Test URL"
 
-    @pytest.mark.asyncio
     async def test_convert_url_invalid(self, converter):
         with pytest.raises(ValueError):
             await converter.convert_url("not-a-url")
 
 
 class TestMDConverterContextManager:
-    @pytest.mark.asyncio
     async def test_async_context_manager(self, simple_html_file):
         if simple_html_file.exists():
             async with MDConverter() as converter:
@@ -169,7 +162,6 @@ class TestMDConverterEdgeCases:
         converter = MDConverter(timeout=999999)
         assert converter._converter.timeout == 999999
 
-    @pytest.mark.asyncio
     async def test_convert_content_type_edge_cases(self):
         """Test content type edge cases"""
         converter = MDConverter()
@@ -236,7 +228,6 @@ class TestMDConverterNetworkErrors:
     def converter(self):
         return MDConverter(timeout=1)  # Short timeout for testing
 
-    @pytest.mark.asyncio
     async def test_network_timeout_handling(self, converter):
         """Test handling of network timeouts"""
         with patch.object(converter._converter, "convert_url") as mock_convert:
@@ -247,7 +238,6 @@ class TestMDConverterNetworkErrors:
             with pytest.raises(TimeoutError):
                 await converter.convert_url("https://slow-server.example.com")
 
-    @pytest.mark.asyncio
     async def test_invalid_response_handling(self, converter):
         """Test handling of invalid server responses"""
         with patch.object(converter._converter, "convert_content") as mock_convert:
@@ -8,10 +8,14 @@ from src.md_server.core.factories import MarkItDownFactory
 from src.md_server.core.config import Settings
 
 
-def test_markitdown_factory_basic_creation():
-    settings = Settings()
+@pytest.fixture(scope="module")
+def default_settings():
+    # Factories only read settings, so one env-parsed instance serves the module
+    return Settings()
 
-    result = MarkItDownFactory.create(settings)
+
+def test_markitdown_factory_basic_creation(default_settings):
+    result = MarkItDownFactory.create(default_settings)
 
     assert isinstance(result, MarkItDown)
     assert hasattr(result, "_requests_session")
@@ -33,19 +37,15 @@ def test_session_creation_with_proxy_config():
     assert os.environ.get("HTTPS_PROXY") == "https://proxy.example.com:8080"
 
 
-def test_session_creation_without_proxy_config():
-    settings = Settings()
-
-    session = MarkItDownFactory._create_session(settings)
+def test_session_creation_without_proxy_config(default_settings):
+    session = MarkItDownFactory._create_session(default_settings)
 
     assert isinstance(session, requests.Session)
     assert not session.proxies
 
 
-def test_llm_client_creation_without_openai_key():
-    settings = Settings()
-
-    client, model = MarkItDownFactory._create_llm_client(settings)
+def test_llm_client_creation_without_openai_key(default_settings):
+    client, model = MarkItDownFactory._create_llm_client(default_settings)
 
     assert client is None
     assert model is None
@@ -93,10 +93,8 @@ def test_llm_client_creation_import_error():
             sys.modules["openai"] = original_openai
 
 
-def test_azure_credentials_without_config():
-    settings = Settings()
-
-    endpoint, credential = MarkItDownFactory._create_azure_credential(settings)
+def test_azure_credentials_without_config(default_settings):
+    endpoint, credential = MarkItDownFactory._create_azure_credential(default_settings)
 
     assert endpoint is None
     assert credential is None